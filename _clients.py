@@ -0,0 +1,39 @@
+"""
+Shared clients for the maintenance scripts
+One Supabase client (and one pooled httpx session) per process.
+"""
+
+import atexit
+import os
+from functools import lru_cache
+
+import httpx
+from dotenv import load_dotenv
+from supabase import Client, ClientOptions, create_client
+
+load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Keep-alive session shared by every Supabase request in the script."""
+    client = httpx.Client(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        timeout=10
+    )
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=1)
+def get_supabase() -> Client:
+    """
+    Get the service-role Supabase client (bypasses RLS).
+    Raises RuntimeError when SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY is missing.
+    """
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+    if not url or not key:
+        raise RuntimeError("SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY not found in .env")
+    
+    return create_client(url, key, options=ClientOptions(httpx_client=_http_client()))
@@ -1,15 +1,18 @@
 """EAM Cognitive OS - Agents module."""
 
-from app.agents.base import BaseAgentNode, AgentResponse
+from app.agents.base import BaseAgentNode, AgentResponse, load_agent_config
 from app.agents.admisiones import AdmisionesAgent, process_admisiones
 from app.agents.finanzas import FinanzasAgent, process_finanzas
 from app.agents.retencion import RetencionAgent, process_retencion
 from app.agents.comunicaciones import ComunicacionesAgent, process_comunicaciones
 from app.agents.tic import TICAgent, process_tic
+from app.agents.prefetch import prefetch_agent_context
 
 __all__ = [
     "BaseAgentNode",
     "AgentResponse",
+    "load_agent_config",
+    "prefetch_agent_context",
     "AdmisionesAgent",
     "FinanzasAgent",
     "RetencionAgent",
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
+import asyncio
+import time
 
 import structlog
 from langchain_openai import ChatOpenAI
@@ -14,12 +16,66 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
 from app.config import get_settings
-from app.core.state import CognitiveState, AgentSlot, BrainLogEntry, StepType
+from app.core.state import CognitiveState, AgentSlot, BrainLogEntry, StepType, slot_value
 from app.db.models import Agent, AgentModelConfig
+from app.db.supabase import get_async_supabase_admin_client
+from app.db.postgres import get_pg_pool, fetch_agent_by_id
 
 logger = structlog.get_logger(__name__)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Agent Configuration Cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+AGENT_CONFIG_TTL_SECONDS = 300.0
+
+# agent_id -> (loaded_at, in-flight or completed fetch); concurrent callers share one fetch
+_agent_config_cache: dict[str, tuple[float, asyncio.Task]] = {}
+
+
+async def _fetch_agent_config(agent_id: str) -> Agent:
+    # Server-side read: use the Postgres pool when configured
+    if get_pg_pool() is not None:
+        agent = await fetch_agent_by_id(UUID(agent_id))
+        if agent is None:
+            raise ValueError(f"Agent not found: {agent_id}")
+        return agent
+    
+    db = get_async_supabase_admin_client()
+    result = await db.execute(db.table("agents").select("*").eq("id", agent_id).single())
+    
+    if not result.data:
+        raise ValueError(f"Agent not found: {agent_id}")
+    
+    return Agent.model_validate(result.data)
+
+
+async def load_agent_config(agent_id: str) -> Agent:
+    """
+    Load an agent's configuration row from the database.
+    Results are cached for AGENT_CONFIG_TTL_SECONDS; failed loads are not cached.
+    """
+    loop = asyncio.get_running_loop()
+    now = time.monotonic()
+    cached = _agent_config_cache.get(agent_id)
+    if (
+        cached is None
+        or now - cached[0] >= AGENT_CONFIG_TTL_SECONDS
+        or cached[1].get_loop() is not loop
+    ):
+        task = loop.create_task(_fetch_agent_config(agent_id))
+        cached = (now, task)
+        _agent_config_cache[agent_id] = cached
+    
+    try:
+        return await asyncio.shield(cached[1])
+    except Exception:
+        if _agent_config_cache.get(agent_id) is cached:
+            del _agent_config_cache[agent_id]
+        raise
+
+
 class AgentResponse(BaseModel):
     """Structured response from an agent."""
     response: str
@@ -238,7 +294,7 @@ class BaseAgentNode(ABC):
         
         # Add delegation chain context
         if len(state.visited_agents) > 1:
-            parts.append(f"\nAgentes previos consultados: {', '.join([a.value if hasattr(a, 'value') else a for a in state.visited_agents[:-1]])}")
+            parts.append(f"\nAgentes previos consultados: {', '.join(slot_value(a) for a in state.visited_agents[:-1])}")
         
         return "\n".join(parts)
     
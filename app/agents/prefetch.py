@@ -0,0 +1,57 @@
+"""
+Agent Prefetch - Speculative warmup of the routed agent
+Started as soon as the supervisor's decision names an agent, so the agent's
+configuration is already cached when its graph node runs.
+"""
+
+from typing import Optional
+import asyncio
+
+import structlog
+
+from app.core.state import AgentSlot
+from app.agents.base import load_agent_config
+from app.agents.admisiones import ADMISIONES_AGENT_ID
+from app.agents.finanzas import FINANZAS_AGENT_ID
+from app.agents.retencion import RETENCION_AGENT_ID
+from app.agents.comunicaciones import COMUNICACIONES_AGENT_ID
+from app.agents.tic import TIC_AGENT_ID
+
+logger = structlog.get_logger(__name__)
+
+AGENT_IDS: dict[str, str] = {
+    AgentSlot.ADMISIONES.value: ADMISIONES_AGENT_ID,
+    AgentSlot.FINANZAS.value: FINANZAS_AGENT_ID,
+    AgentSlot.RETENCION.value: RETENCION_AGENT_ID,
+    AgentSlot.COMUNICACIONES.value: COMUNICACIONES_AGENT_ID,
+    AgentSlot.TIC.value: TIC_AGENT_ID,
+}
+
+# Strong references so fire-and-forget prefetches aren't garbage collected
+_prefetch_tasks: set[asyncio.Task] = set()
+
+
+async def _prefetch(agent_slot: str, agent_id: str) -> None:
+    try:
+        await load_agent_config(agent_id)
+        logger.debug("Agent context prefetched", agent=agent_slot)
+    except Exception as e:
+        # The agent node will retry the load and surface the error itself
+        logger.debug("Agent prefetch failed", agent=agent_slot, error=str(e))
+
+
+def prefetch_agent_context(agent_slot: str) -> Optional[asyncio.Task]:
+    """
+    Start loading the agent's configuration in the background.
+    
+    A wrong prediction only warms a cache entry, so nothing needs to be
+    discarded. Returns None for "none" or unknown slots.
+    """
+    agent_id = AGENT_IDS.get(agent_slot)
+    if agent_id is None:
+        return None
+    
+    task = asyncio.get_running_loop().create_task(_prefetch(agent_slot, agent_id))
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+    return task
@@ -10,9 +10,8 @@ import structlog
 from langchain_core.tools import BaseTool
 
 from app.core.state import CognitiveState, AgentSlot
-from app.agents.base import BaseAgentNode
+from app.agents.base import BaseAgentNode, load_agent_config
 from app.db.models import Agent
-from app.db.supabase import get_supabase_admin_client
 
 logger = structlog.get_logger(__name__)
 
@@ -43,30 +42,7 @@ class RetencionAgent(BaseAgentNode):
 
 async def get_retencion_agent() -> RetencionAgent:
     """Load Retención agent from database."""
-    client = get_supabase_admin_client()
-    result = client.table("agents").select("*").eq("id", RETENCION_AGENT_ID).single().execute()
-    
-    if not result.data:
-        raise ValueError(f"Retención agent not found: {RETENCION_AGENT_ID}")
-    
-    agent_data = result.data
-    config = Agent(
-        id=agent_data["id"],
-        name=agent_data["name"],
-        role=agent_data["role"],
-        avatar=agent_data["avatar"],
-        status=agent_data["status"],
-        department=agent_data["department"],
-        specialization=agent_data["specialization"],
-        goal=agent_data["goal"],
-        tools=agent_data.get("tools", []),
-        system_prompt=agent_data.get("system_prompt"),
-        model_config_data=agent_data.get("model_config"),
-        is_active=agent_data.get("is_active", True),
-        created_at=agent_data["created_at"],
-        updated_at=agent_data["updated_at"]
-    )
-    
+    config = await load_agent_config(RETENCION_AGENT_ID)
     return RetencionAgent(config)
 
 
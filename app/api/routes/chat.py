@@ -10,22 +10,26 @@ import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-import json
 
 from app.config import get_settings
-from app.core.state import CognitiveState, SecurityContext
+from app.core.state import CognitiveState, GenUIPayload, SecurityContext
 from app.core.graph import get_cognitive_graph, get_cognitive_graph_async
 from app.core.checkpointer import persist_brain_log, update_run_status
 from app.db.supabase import get_supabase_admin_client
 from app.db.models import MessageCreate, SenderType, RunStatus
 from app.security.zero_trust import get_current_user, build_security_context, require_auth
 from app.security.audit import log_access, AuditContext
-from app.protocols.genui import stream_genui_payloads
+from app.protocols.genui import encode_sse_event, stream_genui_payloads
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
+# Static SSE frames, encoded once
+_SSE_START = encode_sse_event("start", {"status": "processing"})
+_SSE_THINKING_SUPERVISOR = encode_sse_event("thinking", {"node": "supervisor", "status": "routing"})
+_SSE_END = encode_sse_event("end", {"status": "complete"})
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Request/Response Models
@@ -143,9 +147,8 @@ async def send_message(
             
             final_state = await graph.ainvoke(initial_state, config)
             
-            # Persist brain log
-            if hasattr(final_state, 'brain_log'):
-                await persist_brain_log(run_id, final_state.brain_log)
+            # Persist brain log (ainvoke returns the state as a dict)
+            persist_brain_log(run_id, final_state.get("brain_log") or [])
             
             # Get response
             response_text = final_state.get("final_response") or final_state.get("current_response") or ""
@@ -209,7 +212,7 @@ async def send_message_stream(
             # Similar logic to send_message but with streaming
             security_context = await build_security_context(request, user)
             
-            yield f"event: start\ndata: {json.dumps({'status': 'processing'})}\n\n"
+            yield _SSE_START
             
             # Build and run graph (simplified for streaming)
             conv_id = payload.conversation_id or uuid4()
@@ -228,7 +231,7 @@ async def send_message_stream(
             
             # Use ainvoke instead of astream_events to avoid
             # NotImplementedError from sync SupabaseCheckpointer
-            yield f"event: thinking\ndata: {json.dumps({'node': 'supervisor', 'status': 'routing'})}\n\n"
+            yield _SSE_THINKING_SUPERVISOR
             
             final_state = await graph.ainvoke(initial_state, config)
             
@@ -238,22 +241,28 @@ async def send_message_stream(
                 
                 # Send any GenUI payloads
                 for genui_item in final_state.get("genui_payloads", []):
-                    yield f"event: genui\ndata: {json.dumps(genui_item.model_dump() if hasattr(genui_item, 'model_dump') else genui_item)}\n\n"
+                    yield encode_sse_event(
+                        "genui",
+                        genui_item.model_dump() if isinstance(genui_item, GenUIPayload) else genui_item
+                    )
             else:
                 response_text = str(final_state) if final_state else ""
             
             if not response_text:
                 response_text = "El agente procesó la solicitud pero no generó una respuesta de texto."
             
-            yield f"event: response\ndata: {json.dumps({'response': response_text})}\n\n"
-            yield f"event: end\ndata: {json.dumps({'status': 'complete'})}\n\n"
+            yield encode_sse_event("response", {"response": response_text})
+            yield _SSE_END
             
         except Exception as e:
             import traceback
             error_msg = str(e) or f"{type(e).__name__}: {repr(e)}"
             tb = traceback.format_exc()
             logger.error("Stream error", error=error_msg, traceback=tb)
-            yield f"event: error\ndata: {json.dumps({'error': error_msg, 'type': type(e).__name__, 'traceback': tb[:500]})}\n\n"
+            yield encode_sse_event(
+                "error",
+                {"error": error_msg, "type": type(e).__name__, "traceback": tb[:500]}
+            )
     
     return StreamingResponse(
         event_generator(),
@@ -68,7 +68,7 @@ async def review_request(
     user = Depends(require_auth())
 ) -> dict[str, Any]:
     """Review (approve/reject) a HITL request."""
-    if review.status not in [HITLStatus.APPROVED, HITLStatus.REJECTED]:
+    if review.status not in (HITLStatus.APPROVED, HITLStatus.REJECTED):
         raise HTTPException(
             status_code=400,
             detail="El estado debe ser 'approved' o 'rejected'"
@@ -94,7 +94,7 @@ async def review_request(
     # If approved, resume execution
     result = {"request": updated.model_dump(), "resumed": False}
     
-    if review.status == HITLStatus.APPROVED:
+    if review.status is HITLStatus.APPROVED:
         resume_result = await resume_after_hitl(request_id)
         if resume_result:
             result["resumed"] = True
@@ -10,7 +10,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from app.db.supabase import get_supabase_admin_client
-from app.db.models import MemoryType, MemoryCreate
+from app.db.models import MemoryType, MemoryCreate, vector_literal
+from app.core.llm import generate_embedding
 from app.security.zero_trust import require_auth
 
 logger = structlog.get_logger(__name__)
@@ -70,8 +71,10 @@ async def create_memory(
         "metadata": memory.metadata
     }
     
-    # TODO: Generate embedding for vector search
-    # memory_data["embedding"] = await generate_embedding(memory.content)
+    # Embedding for match_memories; skipped when the provider call failed
+    embedding = await generate_embedding(memory.content)
+    if any(embedding):
+        memory_data["embedding"] = vector_literal(embedding)
     
     result = client.table("memories").insert(memory_data).execute()
     
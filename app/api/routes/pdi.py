@@ -13,6 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
 from app.db.supabase import get_supabase_admin_client
+from app.db.models import vector_literal
 from app.security.zero_trust import require_auth
 from app.core.llm import get_llm_client, generate_embedding
 
@@ -294,7 +295,7 @@ async def process_pdi_document(document_id: str):
                 "entity_type": entity["entity_type"],
                 "description": entity.get("description", ""),
                 "source_text": entity.get("source_text", ""),
-                "embedding": embedding,
+                "embedding": vector_literal(embedding),
                 "metadata": {}
             }).execute()
             
@@ -326,7 +327,7 @@ async def process_pdi_document(document_id: str):
             "community_id": community_id,
             "summary_text": summary_text,
             "key_themes": entity_names[:5],
-            "embedding": summary_embedding
+            "embedding": vector_literal(summary_embedding)
         }).execute()
         
         # Mark as ready
@@ -543,7 +544,7 @@ async def semantic_search(
     # Vector similarity search using pgvector
     # Note: This requires a database function for vector similarity
     result = client.rpc("match_pdi_entities", {
-        "query_embedding": query_embedding,
+        "query_embedding": vector_literal(query_embedding),
         "match_threshold": 0.5,
         "match_count": request.limit
     }).execute()
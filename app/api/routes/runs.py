@@ -9,6 +9,7 @@ import structlog
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.db.supabase import get_supabase_admin_client
+from app.core.checkpointer import decode_tool_output
 from app.security.zero_trust import require_auth
 
 logger = structlog.get_logger(__name__)
@@ -67,9 +68,13 @@ async def get_run_brain_log(
         "run_id", str(run_id)
     ).order("created_at").execute()
     
+    entries = result.data or []
+    for entry in entries:
+        entry["tool_output"] = decode_tool_output(entry.get("tool_output"))
+    
     return {
         "run_id": run_id,
-        "entries": result.data or [],
+        "entries": entries,
         "total": len(result.data) if result.data else 0
     }
 
@@ -86,6 +86,22 @@ class Settings(BaseSettings):
         default=None,
         description="Supabase JWT secret for local validation"
     )
+    supabase_db_url: Optional[SecretStr] = Field(
+        default=None,
+        description="Direct Postgres connection string for server-side queries (asyncpg)"
+    )
+    db_pool_min_size: int = Field(
+        default=2,
+        description="Minimum connections kept in the asyncpg pool"
+    )
+    db_pool_max_size: int = Field(
+        default=20,
+        description="Maximum connections in the asyncpg pool"
+    )
+    supabase_thread_limit: int = Field(
+        default=16,
+        description="Maximum concurrent blocking supabase-py calls in worker threads"
+    )
     
     # ─────────────────────────────────────────────────────────────────────────
     # Application Settings
@@ -120,6 +136,42 @@ class Settings(BaseSettings):
         description="Maximum iterations per agent execution"
     )
     
+    # ─────────────────────────────────────────────────────────────────────────
+    # Supervisor Routing
+    # ─────────────────────────────────────────────────────────────────────────
+    supervisor_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse routing decisions for semantically similar messages"
+    )
+    supervisor_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a routing cache hit"
+    )
+    supervisor_cache_ttl_seconds: int = Field(
+        default=86400,
+        description="Seconds a cached routing decision stays valid"
+    )
+    supervisor_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum cached routing decisions (LRU eviction)"
+    )
+    supervisor_cache_embed_timeout_ms: int = Field(
+        default=150,
+        description="Longest a cache miss waits on the lookup embedding before calling the LLM"
+    )
+    supervisor_local_threshold: float = Field(
+        default=0.75,
+        ge=0.0,
+        le=1.0,
+        description="Minimum zero-shot score to route locally without calling the LLM"
+    )
+    supervisor_local_model: str = Field(
+        default="MoritzLaurer/multilingual-MiniLMv2-L6-mnli-xnli",
+        description="Multilingual zero-shot model for local routing (requires 'local-routing' extra)"
+    )
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Institutional Context (Single-Tenant)
     # ─────────────────────────────────────────────────────────────────────────
@@ -8,6 +8,7 @@ from app.core.state import (
     SecurityContext,
     OKRContext,
     GenUIPayload,
+    slot_value,
 )
 from app.core.dsee import (
     DSEEEngine,
@@ -18,6 +19,8 @@ from app.core.dsee import (
 )
 from app.core.checkpointer import (
     SupabaseCheckpointer,
+    BrainLogWriter,
+    get_brain_log_writer,
     persist_brain_log,
     update_run_status,
 )
@@ -32,12 +35,15 @@ __all__ = [
     "SecurityContext",
     "OKRContext",
     "GenUIPayload",
+    "slot_value",
     "DSEEEngine",
     "get_dsee_engine",
     "transition_start_agent",
     "transition_complete_response",
     "transition_request_hitl",
     "SupabaseCheckpointer",
+    "BrainLogWriter",
+    "get_brain_log_writer",
     "persist_brain_log",
     "update_run_status",
     "supervisor_node",
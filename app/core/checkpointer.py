@@ -3,12 +3,16 @@ Supabase Checkpointer for LangGraph
 Persists graph state to Supabase for durability and recovery.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional, Sequence
 from uuid import UUID
+import asyncio
+import base64
 import json
+import threading
 
 import structlog
+import zstandard
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
     Checkpoint,
@@ -17,12 +21,103 @@ from langgraph.checkpoint.base import (
 )
 from pydantic import BaseModel
 
-from app.db.supabase import get_supabase_admin_client
-from app.core.state import CognitiveState, BrainLogEntry
+from app.db.supabase import get_supabase_admin_client, get_async_supabase_admin_client
+from app.db.postgres import get_pg_pool, copy_brain_log
+from app.db.models import BrainLogCreate
+from app.core.state import CognitiveState, BrainLogEntry, brain_log_entry_to_dict
 
 logger = structlog.get_logger(__name__)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Payload Compression
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Payloads above this size (serialized bytes) are zstd-compressed before persistence
+COMPRESSION_THRESHOLD = 1024
+
+# Checkpoint columns always hold JSON text, which never starts with "Z", so a
+# single prefix byte marks compressed payloads there
+_ZSTD_SENTINEL = "Z"
+
+# Shared process-level codecs (zstandard contexts are not safe for concurrent use)
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+_ZSTD_LOCK = threading.Lock()
+
+
+def encode_payload(serialized: str) -> str:
+    """
+    Compress a serialized JSON payload if it exceeds the threshold.
+    
+    Small payloads are returned as-is; large ones become the sentinel
+    followed by the base64 of the zstd frame (text-safe for JSONB/TEXT columns).
+    """
+    raw = serialized.encode("utf-8")
+    if len(raw) <= COMPRESSION_THRESHOLD:
+        return serialized
+    
+    with _ZSTD_LOCK:
+        compressed = _ZSTD_COMPRESSOR.compress(raw)
+    return _ZSTD_SENTINEL + base64.b64encode(compressed).decode("ascii")
+
+
+def decode_payload(stored: str) -> str:
+    """Inverse of encode_payload: return the original serialized JSON text."""
+    if not stored or not stored.startswith(_ZSTD_SENTINEL):
+        return stored
+    
+    compressed = base64.b64decode(stored[1:])
+    with _ZSTD_LOCK:
+        raw = _ZSTD_DECOMPRESSOR.decompress(compressed)
+    return raw.decode("utf-8")
+
+
+# tool_output may be any JSON value (including plain strings), so compressed
+# outputs are wrapped in an explicit envelope instead of a text prefix
+_ZSTD_ENVELOPE_KEY = "__zstd__"
+
+
+def encode_tool_output(tool_output: Any) -> Any:
+    """
+    Prepare a brain_log tool_output for persistence.
+    Large outputs are stored as {"__zstd__": <base64 zstd frame>}, small ones unchanged.
+    """
+    if tool_output is None:
+        return None
+    if callable(tool_output):
+        return str(tool_output)
+    
+    raw = json.dumps(tool_output, default=str).encode("utf-8")
+    if len(raw) <= COMPRESSION_THRESHOLD:
+        return tool_output
+    
+    with _ZSTD_LOCK:
+        compressed = _ZSTD_COMPRESSOR.compress(raw)
+    return {_ZSTD_ENVELOPE_KEY: base64.b64encode(compressed).decode("ascii")}
+
+
+def decode_tool_output(stored: Any) -> Any:
+    """Restore a tool_output persisted by encode_tool_output."""
+    if not (isinstance(stored, dict) and stored.keys() == {_ZSTD_ENVELOPE_KEY}):
+        return stored
+    
+    compressed = base64.b64decode(stored[_ZSTD_ENVELOPE_KEY])
+    with _ZSTD_LOCK:
+        raw = _ZSTD_DECOMPRESSOR.decompress(compressed)
+    return json.loads(raw)
+
+
+def _dump_column(value: Any) -> str:
+    """Serialize a checkpoint column, compressing large values."""
+    return encode_payload(json.dumps(value))
+
+
+def _load_column(stored: str) -> Any:
+    """Deserialize a checkpoint column written by _dump_column."""
+    return json.loads(decode_payload(stored))
+
+
 class SupabaseCheckpointer(BaseCheckpointSaver):
     """
     LangGraph checkpointer that persists state to Supabase.
@@ -56,16 +151,16 @@ class SupabaseCheckpointer(BaseCheckpointSaver):
                 v=row.get("v", 1),
                 id=row["checkpoint_id"],
                 ts=row.get("ts", datetime.utcnow().isoformat()),
-                channel_values=json.loads(row.get("channel_values", "{}")),
-                channel_versions=json.loads(row.get("channel_versions", "{}")),
-                versions_seen=json.loads(row.get("versions_seen", "{}")),
-                pending_sends=json.loads(row.get("pending_sends", "[]")),
+                channel_values=_load_column(row.get("channel_values", "{}")),
+                channel_versions=_load_column(row.get("channel_versions", "{}")),
+                versions_seen=_load_column(row.get("versions_seen", "{}")),
+                pending_sends=_load_column(row.get("pending_sends", "[]")),
             )
             
             metadata = CheckpointMetadata(
                 source=row.get("source", "unknown"),
                 step=row.get("step", 0),
-                writes=json.loads(row.get("writes", "{}")),
+                writes=_load_column(row.get("writes", "{}")),
             )
             
             return CheckpointTuple(
@@ -111,16 +206,16 @@ class SupabaseCheckpointer(BaseCheckpointSaver):
                     v=row.get("v", 1),
                     id=row["checkpoint_id"],
                     ts=row.get("ts", datetime.utcnow().isoformat()),
-                    channel_values=json.loads(row.get("channel_values", "{}")),
-                    channel_versions=json.loads(row.get("channel_versions", "{}")),
-                    versions_seen=json.loads(row.get("versions_seen", "{}")),
-                    pending_sends=json.loads(row.get("pending_sends", "[]")),
+                    channel_values=_load_column(row.get("channel_values", "{}")),
+                    channel_versions=_load_column(row.get("channel_versions", "{}")),
+                    versions_seen=_load_column(row.get("versions_seen", "{}")),
+                    pending_sends=_load_column(row.get("pending_sends", "[]")),
                 )
                 
                 metadata = CheckpointMetadata(
                     source=row.get("source", "unknown"),
                     step=row.get("step", 0),
-                    writes=json.loads(row.get("writes", "{}")),
+                    writes=_load_column(row.get("writes", "{}")),
                 )
                 
                 checkpoints.append(CheckpointTuple(
@@ -154,13 +249,13 @@ class SupabaseCheckpointer(BaseCheckpointSaver):
                 "checkpoint_id": checkpoint["id"],
                 "v": checkpoint.get("v", 1),
                 "ts": checkpoint.get("ts", datetime.utcnow().isoformat()),
-                "channel_values": json.dumps(checkpoint.get("channel_values", {})),
-                "channel_versions": json.dumps(checkpoint.get("channel_versions", {})),
-                "versions_seen": json.dumps(checkpoint.get("versions_seen", {})),
-                "pending_sends": json.dumps(checkpoint.get("pending_sends", [])),
+                "channel_values": _dump_column(checkpoint.get("channel_values", {})),
+                "channel_versions": _dump_column(checkpoint.get("channel_versions", {})),
+                "versions_seen": _dump_column(checkpoint.get("versions_seen", {})),
+                "pending_sends": _dump_column(checkpoint.get("pending_sends", [])),
                 "source": metadata.get("source", "unknown"),
                 "step": metadata.get("step", 0),
-                "writes": json.dumps(metadata.get("writes", {})),
+                "writes": _dump_column(metadata.get("writes", {})),
             }
             
             self._client.table("graph_checkpoints").upsert(row).execute()
@@ -193,43 +288,85 @@ class SupabaseCheckpointer(BaseCheckpointSaver):
 # Brain Log Persistence
 # ─────────────────────────────────────────────────────────────────────────────
 
-async def persist_brain_log(run_id: UUID, entries: list[BrainLogEntry]) -> None:
+class BrainLogWriter:
+    """
+    Background bulk writes of brain log rows.
+    
+    Each completed run is written in one statement (COPY through the asyncpg
+    pool, or a single PostgREST insert when no pool is configured) on a
+    background task, so the request never waits on the database.
+    """
+    
+    def __init__(self):
+        self._tasks: set[asyncio.Task] = set()
+    
+    def submit(self, run_id: UUID, batch: list[BrainLogCreate]) -> None:
+        """Schedule the write of a run's rows."""
+        task = asyncio.get_running_loop().create_task(self._write(run_id, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def drain(self) -> None:
+        """Wait for pending writes (shutdown)."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def _write(self, run_id: UUID, batch: list[BrainLogCreate]) -> None:
+        try:
+            if get_pg_pool() is not None:
+                await copy_brain_log(batch)
+            else:
+                rows = [entry.model_dump(mode="json") for entry in batch]
+                db = get_async_supabase_admin_client()
+                await db.execute(db.table("brain_log").insert(rows))
+            logger.debug(
+                "Brain log persisted",
+                run_id=str(run_id),
+                entries=len(batch)
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to persist brain log",
+                run_id=str(run_id),
+                entries=len(batch),
+                error=str(e)
+            )
+
+
+_brain_log_writer: Optional[BrainLogWriter] = None
+
+
+def get_brain_log_writer() -> BrainLogWriter:
+    """Get or create the process-wide brain log writer."""
+    global _brain_log_writer
+    if _brain_log_writer is None:
+        _brain_log_writer = BrainLogWriter()
+    return _brain_log_writer
+
+
+def persist_brain_log(run_id: UUID, entries: list[BrainLogEntry]) -> None:
     """
     Persist brain log entries to Supabase.
-    Called after each agent step completes.
+    Called when a run completes; the write happens in the background.
     """
     if not entries:
         return
     
-    client = get_supabase_admin_client()
-    
-    rows = []
+    batch = []
     for entry in entries:
-        rows.append({
-            "run_id": str(run_id),
-            "step_type": entry.step_type.value if hasattr(entry.step_type, 'value') else entry.step_type,
-            "content": entry.content,
-            "tool_name": entry.tool_name,
-            "tool_input": entry.tool_input,
-            "tool_output": entry.tool_output if not callable(entry.tool_output) else str(entry.tool_output),
-            "tokens_used": entry.tokens_used,
-            "duration_ms": entry.duration_ms,
-            "created_at": entry.timestamp.isoformat()
-        })
-    
-    try:
-        client.table("brain_log").insert(rows).execute()
-        logger.debug(
-            "Brain log persisted",
-            run_id=str(run_id),
-            entries=len(rows)
-        )
-    except Exception as e:
-        logger.error(
-            "Failed to persist brain log",
-            run_id=str(run_id),
-            error=str(e)
-        )
+        data = brain_log_entry_to_dict(entry)
+        batch.append(BrainLogCreate(
+            run_id=run_id,
+            step_type=data["step_type"],
+            content=data["content"],
+            tool_name=data["tool_name"],
+            tool_input=data["tool_input"],
+            tool_output=encode_tool_output(data["tool_output"]),
+            tokens_used=data["tokens_used"],
+            duration_ms=data["duration_ms"],
+            created_at=data["timestamp"]
+        ))
+    get_brain_log_writer().submit(run_id, batch)
 
 
 async def update_run_status(
@@ -239,11 +376,11 @@ async def update_run_status(
     error_message: Optional[str] = None
 ) -> None:
     """Update an agent run's status in the database."""
-    client = get_supabase_admin_client()
+    db = get_async_supabase_admin_client()
     
     update_data = {
         "status": status,
-        "completed_at": datetime.utcnow().isoformat() if status in ("completed", "failed") else None
+        "completed_at": datetime.now(timezone.utc).isoformat() if status in ("completed", "failed") else None
     }
     
     if result:
@@ -252,7 +389,7 @@ async def update_run_status(
         update_data["error_message"] = error_message
     
     try:
-        client.table("agent_runs").update(update_data).eq("id", str(run_id)).execute()
+        await db.execute(db.table("agent_runs").update(update_data).eq("id", str(run_id)))
         logger.info("Run status updated", run_id=str(run_id), status=status)
     except Exception as e:
         logger.error("Failed to update run status", run_id=str(run_id), error=str(e))
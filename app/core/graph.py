@@ -10,7 +10,7 @@ import structlog
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.state import CompiledStateGraph
 
-from app.core.state import CognitiveState, AgentSlot
+from app.core.state import CognitiveState, AgentSlot, slot_value
 from app.core.supervisor import supervisor_node, route_to_agent
 from app.core.checkpointer import SupabaseCheckpointer
 
@@ -102,7 +102,7 @@ async def end_node(state: CognitiveState) -> dict[str, Any]:
     logger.info(
         "Execution complete",
         run_id=str(state.run_id),
-        visited_agents=[a.value if hasattr(a, 'value') else a for a in state.visited_agents]
+        visited_agents=[slot_value(a) for a in state.visited_agents]
     )
     
     # Finalize response if not already set
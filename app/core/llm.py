@@ -3,7 +3,12 @@ LLM Client Utilities - Unified interface for LLM and embedding calls
 Uses Vercel AI Gateway or direct OpenAI API
 """
 
+from collections import OrderedDict
 from typing import Optional
+import hashlib
+import os
+
+import numpy as np
 import structlog
 from openai import AsyncOpenAI
 
@@ -13,6 +18,17 @@ logger = structlog.get_logger(__name__)
 
 _llm_client: Optional[AsyncOpenAI] = None
 
+# Same default the OpenAI SDK applies when OPENAI_BASE_URL is unset
+OPENAI_DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+def get_llm_base_url() -> str:
+    """Base URL the LLM client targets for the configured provider (no client is built)."""
+    settings = get_settings()
+    if settings.llm_provider.upper() == "VERCEL":
+        return settings.vercel_ai_gateway_url
+    return os.getenv("OPENAI_BASE_URL") or OPENAI_DEFAULT_BASE_URL
+
 
 def get_llm_client() -> AsyncOpenAI:
     """Get or create the LLM client singleton."""
@@ -27,7 +43,7 @@ def get_llm_client() -> AsyncOpenAI:
                 
             _llm_client = AsyncOpenAI(
                 api_key=settings.vercel_ai_gateway_token.get_secret_value(),
-                base_url=settings.vercel_ai_gateway_url
+                base_url=get_llm_base_url()
             )
             logger.info("LLM client initialized with Vercel AI Gateway")
         else:
@@ -36,39 +52,69 @@ def get_llm_client() -> AsyncOpenAI:
             if settings.openai_api_key:
                 api_key = settings.openai_api_key.get_secret_value()
             else:
-                import os
                 api_key = os.getenv("OPENAI_API_KEY")
             
             if not api_key:
                 logger.warning("No OpenAI API key found. LLM calls may fail.")
             
             _llm_client = AsyncOpenAI(
-                api_key=api_key or "dummy_key_for_build"
+                api_key=api_key or "dummy_key_for_build",
+                base_url=get_llm_base_url()
             )
             logger.info("LLM client initialized with direct OpenAI")
     
     return _llm_client
 
 
+# Embedding models accept 8191 tokens; ~4 bytes per token keeps inputs under the limit
+MAX_EMBEDDING_BYTES = 30000
+
+# LRU of embeddings keyed by (text digest, model), stored as float32 arrays:
+# ~6 KB per 1536-dim entry, so 4096 entries stay around 25 MB per process
+EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[tuple[bytes, str], np.ndarray]" = OrderedDict()
+
+
+def _truncate_for_embedding(text: str) -> str:
+    """Truncate text to MAX_EMBEDDING_BYTES of UTF-8 without splitting a character."""
+    # A character is at most 4 bytes, so short texts need no encoding at all
+    if len(text) <= MAX_EMBEDDING_BYTES // 4:
+        return text
+    
+    encoded = text.encode("utf-8")
+    if len(encoded) <= MAX_EMBEDDING_BYTES:
+        return text
+    return encoded[:MAX_EMBEDDING_BYTES].decode("utf-8", errors="ignore")
+
+
 async def generate_embedding(text: str, model: str = "text-embedding-3-small") -> list[float]:
     """Generate embedding vector for text using OpenAI embeddings API."""
-    client = get_llm_client()
+    text = _truncate_for_embedding(text)
     
-    # Truncate text if too long (8191 tokens max for embedding models)
-    max_chars = 30000  # Rough estimate, ~4 chars per token
-    if len(text) > max_chars:
-        text = text[:max_chars]
+    cache_key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), model)
+    cached = _embedding_cache.get(cache_key)
+    if cached is not None:
+        _embedding_cache.move_to_end(cache_key)
+        return cached.tolist()
+    
+    client = get_llm_client()
     
     try:
         response = await client.embeddings.create(
             model=model,
             input=text
         )
-        return response.data[0].embedding
+        embedding = response.data[0].embedding
     except Exception as e:
         logger.error("Embedding generation failed", error=str(e), text_length=len(text))
         # Return zero vector as fallback (1536 dimensions for text-embedding-3-small)
         return [0.0] * 1536
+    
+    _embedding_cache[cache_key] = np.asarray(embedding, dtype=np.float32)
+    if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
+    
+    return embedding
 
 
 async def chat_completion(
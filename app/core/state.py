@@ -6,10 +6,11 @@ Implements the DSEE (Deterministic State Evolution Engine) pattern.
 
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any, Optional
+from functools import cached_property
+from typing import Annotated, Any, Optional, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from langgraph.graph.message import add_messages
 
 
@@ -35,6 +36,16 @@ class StepType(str, Enum):
     ERROR = "error"
 
 
+def slot_value(slot: Union[AgentSlot, str]) -> str:
+    """
+    Plain string value of an agent slot.
+    State fields may hold AgentSlot members (set in nodes) or raw values
+    (after validation with use_enum_values); isinstance avoids the
+    AttributeError path of hasattr(slot, "value") on plain strings.
+    """
+    return slot.value if isinstance(slot, AgentSlot) else slot
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Nested State Components
 # ─────────────────────────────────────────────────────────────────────────────
@@ -74,6 +85,7 @@ class SecurityContext(BaseModel):
     Used for Zero Trust validation and audit logging.
     """
     user_id: str  # Stored as str for LangGraph serialization compat
+    is_anonymous: bool = False  # user_id is the nil-UUID placeholder
     access_level: str = "externo"  # 'sede_principal', 'vpn_institucional', 'externo'
     device_verified: bool = False
     session_id: str
@@ -180,6 +192,24 @@ class CognitiveState(BaseModel):
     class Config:
         use_enum_values = True
     
+    # ─────────────────────────────────────────────────────────────────────────
+    # Prompt Formatting (memoized per state; mark_visited invalidates)
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    @cached_property
+    def okr_ids_str(self) -> str:
+        """Aligned OKR ids formatted for prompts."""
+        if not self.okr_context or not self.okr_context.aligned_okr_ids:
+            return "ninguno"
+        return ", ".join(map(str, self.okr_context.aligned_okr_ids))
+    
+    @cached_property
+    def visited_agents_str(self) -> str:
+        """Visited agent slots formatted for prompts."""
+        if not self.visited_agents:
+            return "ninguno"
+        return ", ".join(slot_value(a) for a in self.visited_agents)
+    
     # ─────────────────────────────────────────────────────────────────────────
     # Helper Methods
     # ─────────────────────────────────────────────────────────────────────────
@@ -266,6 +296,7 @@ class CognitiveState(BaseModel):
         """Mark an agent as visited in this run."""
         if agent not in self.visited_agents:
             self.visited_agents.append(agent)
+            self.__dict__.pop("visited_agents_str", None)
         self.updated_at = datetime.utcnow()
         return self
     
@@ -283,3 +314,16 @@ class CognitiveState(BaseModel):
         self.is_complete = True
         self.updated_at = datetime.utcnow()
         return self
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Serialization
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Built once per process so the serializer schema is compiled a single time
+_ENTRY_ADAPTER = TypeAdapter(BrainLogEntry)
+
+
+def brain_log_entry_to_dict(entry: BrainLogEntry) -> dict[str, Any]:
+    """Convert a brain log entry to a JSON-compatible dict (enums as values, ISO timestamps)."""
+    return _ENTRY_ADAPTER.dump_python(entry, mode="json", fallback=str)
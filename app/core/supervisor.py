@@ -3,19 +3,30 @@ Supervisor Node - Agent Router
 Routes user messages to the appropriate departmental agent(s).
 """
 
-from typing import Any, Literal
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Literal, Optional, get_args
 from uuid import UUID
+import asyncio
+import re
+import threading
+import time
 
+import numpy as np
 import structlog
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 
 from app.config import get_settings
-from app.core.state import CognitiveState, AgentSlot
+from app.core.llm import generate_embedding
+from app.core.state import CognitiveState, AgentSlot, slot_value
 
 logger = structlog.get_logger(__name__)
 
+AgentSelectedCallback = Callable[[str], Any]
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Routing Schema
@@ -95,20 +106,401 @@ Tu rol es analizar las solicitudes de los usuarios y enrutarlas al agente depart
 - Sistema single-tenant para la EAM
 - Prioriza la eficiencia operativa
 - Considera los OKRs institucionales en tus decisiones
+
+## Formato de Respuesta:
+Responde únicamente con un objeto JSON con estas claves, en este orden:
+{"selected_agent": "admisiones|finanzas|retencion|comunicaciones|tic|none", "confidence": 0.0-1.0, "reasoning": "explicación breve", "requires_collaboration": false, "secondary_agents": []}
 """
 
+# Built once: the system prompt never changes between routing calls
+_SUPERVISOR_SYSMSG = SystemMessage(content=SUPERVISOR_SYSTEM_PROMPT)
+
+# Static framing first and the user's message last, so every routing request
+# shares the longest possible byte-identical prefix for provider prompt caching
+_ROUTER_REQUEST_TEMPLATE = """Analiza esta solicitud y decide el enrutamiento.
+
+Considera:
+- OKRs alineados: {okr_ids}
+- Agentes ya visitados en esta sesión: {visited_agents}
+
+Solicitud:
+{user_message}
+"""
+
+# Routes all supervisor calls to the same provider cache shard
+_ROUTER_PROMPT_CACHE_KEY = "eam-supervisor-router"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Semantic Routing Cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+_NORMALIZE_PATTERN = re.compile(r"[\W\d_]+")
+
+
+def normalize_routing_message(message: str) -> str:
+    """Lowercase and strip punctuation/digits so near-identical requests share a key."""
+    return " ".join(_NORMALIZE_PATTERN.sub(" ", message.lower()).split())
+
+
+# (visited agents, OKR ids in the prompt): decisions never cross partitions
+RoutePartition = tuple[tuple[str, ...], str]
+_RouterCacheKey = tuple[RoutePartition, str]
+
+# Initial rows of the vector matrix; doubles up to max_entries
+_ROUTER_CACHE_INITIAL_ROWS = 256
+
+
+class RouterCache:
+    """
+    Semantic cache of supervisor routing decisions.
+    
+    Entries are keyed by the normalized user message and partitioned by the
+    visited agents and OKR context of the prompt. A lookup hits when the
+    normalized text matches exactly, or when the cosine similarity of its
+    embedding with a cached entry reaches the threshold.
+    
+    Vectors live in one contiguous float32 matrix scored with a single
+    matrix-vector product. Expired entries are dropped when hit and by a
+    periodic sweep; the least recently used are evicted beyond max_entries.
+    """
+    
+    def __init__(
+        self,
+        threshold: float,
+        ttl_seconds: int,
+        max_entries: int,
+        embed_timeout: float
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.embed_timeout = embed_timeout
+        self._lru: OrderedDict[_RouterCacheKey, int] = OrderedDict()  # key -> row
+        self._matrix: Optional[np.ndarray] = None
+        self._in_use = np.zeros(0, dtype=bool)
+        self._created = np.zeros(0, dtype=np.float64)
+        self._partition_hash = np.zeros(0, dtype=np.int64)
+        self._row_keys: list[Optional[_RouterCacheKey]] = []
+        self._decisions: list[Optional[str]] = []
+        self._free: list[int] = []
+        self._rows_used = 0
+        self._next_sweep = 0.0
+    
+    async def _embed(self, normalized: str) -> Optional[np.ndarray]:
+        settings = get_settings()
+        vector = np.asarray(
+            await generate_embedding(normalized, model=settings.embedding_model),
+            dtype=np.float32
+        )
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            # Embedding failed (zero-vector fallback) - not usable for similarity
+            return None
+        return vector / norm
+    
+    def _is_expired(self, row: int, now: float) -> bool:
+        return now - self._created[row] > self.ttl_seconds
+    
+    def _hit(self, key: _RouterCacheKey) -> RouterDecision:
+        self._lru.move_to_end(key)
+        return RouterDecision.model_validate_json(self._decisions[self._lru[key]])
+    
+    def get(self, message: str, partition: RoutePartition) -> Optional[RouterDecision]:
+        """Exact-match lookup on the normalized message; never embeds."""
+        key = (partition, normalize_routing_message(message))
+        row = self._lru.get(key)
+        if row is None:
+            return None
+        if self._is_expired(row, time.monotonic()):
+            self._remove(key)
+            return None
+        return self._hit(key)
+    
+    async def lookup(
+        self,
+        message: str,
+        partition: RoutePartition
+    ) -> tuple[Optional[RouterDecision], Optional["asyncio.Future[Optional[np.ndarray]]"]]:
+        """
+        Find a cached decision for a message by embedding similarity.
+        
+        Call get() first for exact matches; this starts the (paid) embedding
+        request. The request only delays a miss by up to embed_timeout; it is
+        not awaited while the cache is empty and keeps running for store().
+        
+        Returns:
+            (decision or None, pending embedding to pass to store() on a miss)
+        """
+        now = time.monotonic()
+        normalized = normalize_routing_message(message)
+        
+        embedding = asyncio.ensure_future(self._embed(normalized))
+        if not self._lru:
+            return None, embedding
+        
+        try:
+            vector = await asyncio.wait_for(asyncio.shield(embedding), self.embed_timeout)
+        except asyncio.TimeoutError:
+            return None, embedding
+        if vector is None or self._matrix is None:
+            return None, None
+        
+        rows = self._rows_used
+        scores = self._matrix[:rows] @ vector
+        scores[~self._in_use[:rows] | (self._partition_hash[:rows] != hash(partition))] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None, embedding
+        
+        best_key = self._row_keys[best]
+        if best_key[0] != partition:
+            return None, embedding
+        if self._is_expired(best, now):
+            self._remove(best_key)
+            return None, embedding
+        return self._hit(best_key), None
+    
+    def store(
+        self,
+        message: str,
+        partition: RoutePartition,
+        embedding: Optional["asyncio.Future[Optional[np.ndarray]]"],
+        decision: RouterDecision
+    ) -> None:
+        """Cache a routing decision once its embedding resolves (skipped without one)."""
+        if embedding is None:
+            return
+        
+        key = (partition, normalize_routing_message(message))
+        decision_json = decision.model_dump_json()
+        
+        def insert(done: "asyncio.Future[Optional[np.ndarray]]") -> None:
+            if done.cancelled() or done.exception() is not None:
+                return
+            vector = done.result()
+            if vector is not None:
+                self._insert(key, vector, decision_json)
+        
+        if embedding.done():
+            insert(embedding)
+        else:
+            embedding.add_done_callback(insert)
+    
+    def _insert(self, key: _RouterCacheKey, vector: np.ndarray, decision_json: str) -> None:
+        now = time.monotonic()
+        self._sweep(now)
+        
+        row = self._lru.get(key)
+        if row is None:
+            if not self._free:
+                self._grow(vector.shape[0])
+            if not self._free:
+                self._remove(next(iter(self._lru)))
+            row = self._free.pop()
+            self._rows_used = max(self._rows_used, row + 1)
+        
+        self._lru[key] = row
+        self._lru.move_to_end(key)
+        self._matrix[row] = vector
+        self._in_use[row] = True
+        self._created[row] = now
+        self._partition_hash[row] = hash(key[0])
+        self._row_keys[row] = key
+        self._decisions[row] = decision_json
+    
+    def _grow(self, dim: int) -> None:
+        capacity = len(self._row_keys)
+        new_capacity = min(max(capacity * 2, _ROUTER_CACHE_INITIAL_ROWS), self.max_entries)
+        if new_capacity <= capacity:
+            return
+        
+        matrix = np.zeros((new_capacity, dim), dtype=np.float32)
+        if self._matrix is not None:
+            matrix[:capacity] = self._matrix
+        self._matrix = matrix
+        extra = new_capacity - capacity
+        self._in_use = np.concatenate([self._in_use, np.zeros(extra, dtype=bool)])
+        self._created = np.concatenate([self._created, np.zeros(extra, dtype=np.float64)])
+        self._partition_hash = np.concatenate([self._partition_hash, np.zeros(extra, dtype=np.int64)])
+        self._row_keys.extend([None] * extra)
+        self._decisions.extend([None] * extra)
+        # Lowest rows are handed out first so the scored prefix stays dense
+        self._free.extend(range(new_capacity - 1, capacity - 1, -1))
+    
+    def _remove(self, key: _RouterCacheKey) -> None:
+        row = self._lru.pop(key)
+        self._in_use[row] = False
+        self._row_keys[row] = None
+        self._decisions[row] = None
+        self._free.append(row)
+    
+    def _sweep(self, now: float) -> None:
+        """Drop expired entries, at most once a minute (or once per TTL if shorter)."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + min(self.ttl_seconds, 60)
+        
+        rows = self._rows_used
+        expired = self._in_use[:rows] & (now - self._created[:rows] > self.ttl_seconds)
+        for row in np.flatnonzero(expired):
+            self._remove(self._row_keys[row])
+
+
+_router_cache: Optional[RouterCache] = None
 
+
+def get_router_cache() -> RouterCache:
+    """Get or create the process-wide routing cache."""
+    global _router_cache
+    if _router_cache is None:
+        settings = get_settings()
+        _router_cache = RouterCache(
+            threshold=settings.supervisor_cache_threshold,
+            ttl_seconds=settings.supervisor_cache_ttl_seconds,
+            max_entries=settings.supervisor_cache_max_entries,
+            embed_timeout=settings.supervisor_cache_embed_timeout_ms / 1000
+        )
+    return _router_cache
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Local Zero-Shot Routing
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Candidate label -> agent. The general label gives greetings and off-topic
+# messages somewhere to land, so they are left to the LLM's "none" route.
+_LOCAL_ROUTING_LABELS = {
+    "admisiones": "admisiones",
+    "finanzas": "finanzas",
+    "retencion": "retencion",
+    "comunicaciones": "comunicaciones",
+    "tic": "tic",
+    "un saludo o un tema general": "none",
+}
+_LOCAL_CANDIDATE_LABELS = list(_LOCAL_ROUTING_LABELS)
+_LOCAL_HYPOTHESIS_TEMPLATE = "Esta solicitud es sobre {}."
+
+_local_router: Optional[Any] = None
+_local_router_loaded = False
+_local_router_lock = threading.Lock()
+
+
+def _build_local_router() -> Optional[Any]:
+    try:
+        from transformers import pipeline
+    except ImportError:
+        logger.info("transformers not installed, local routing disabled")
+        return None
+    
+    settings = get_settings()
+    try:
+        return pipeline("zero-shot-classification", model=settings.supervisor_local_model)
+    except Exception as e:
+        logger.warning("Failed to load local routing model", error=str(e))
+        return None
+
+
+def get_local_router() -> Optional[Any]:
+    """
+    Load the zero-shot classification pipeline once per process (blocking).
+    Returns None when the optional 'local-routing' dependencies are missing.
+    """
+    global _local_router, _local_router_loaded
+    if not _local_router_loaded:
+        with _local_router_lock:
+            if not _local_router_loaded:
+                _local_router = _build_local_router()
+                _local_router_loaded = True
+    return _local_router
+
+
+async def load_local_router() -> Optional[Any]:
+    """Load the local router in a worker thread (called at startup)."""
+    if _local_router_loaded:
+        return _local_router
+    return await asyncio.to_thread(get_local_router)
+
+
+async def classify_locally(message: str) -> Optional[RouterDecision]:
+    """
+    Route with the local zero-shot classifier.
+    Returns a department decision only when its score exceeds
+    supervisor_local_threshold; general messages are left to the LLM.
+    """
+    pipe = await load_local_router()
+    if pipe is None:
+        return None
+    
+    result = await asyncio.to_thread(
+        pipe,
+        message,
+        candidate_labels=_LOCAL_CANDIDATE_LABELS,
+        hypothesis_template=_LOCAL_HYPOTHESIS_TEMPLATE
+    )
+    agent = _LOCAL_ROUTING_LABELS[result["labels"][0]]
+    score = float(result["scores"][0])
+    
+    if agent == "none" or score <= get_settings().supervisor_local_threshold:
+        return None
+    
+    return RouterDecision(
+        selected_agent=agent,
+        confidence=score,
+        reasoning=f"Clasificación local zero-shot (score {score:.2f})"
+    )
+
+
+@lru_cache
 def get_supervisor_llm() -> ChatOpenAI:
-    """Get ChatOpenAI configured for Vercel AI Gateway."""
+    """Get ChatOpenAI configured for Vercel AI Gateway (shared, async-safe singleton)."""
     settings = get_settings()
     return ChatOpenAI(
         base_url=settings.vercel_ai_gateway_url,
         api_key=settings.vercel_ai_gateway_token.get_secret_value(),
         model=settings.default_model,
         temperature=0.3,  # Lower temperature for consistent routing
+        extra_body={"prompt_cache_key": _ROUTER_PROMPT_CACHE_KEY},
     )
 
 
+@lru_cache
+def get_streaming_router_chain() -> Any:
+    """Routing LLM in JSON mode piped into a partial-JSON parser (streams dicts)."""
+    json_llm = get_supervisor_llm().bind(response_format={"type": "json_object"})
+    return json_llm | JsonOutputParser()
+
+
+# Labels are not prefixes of one another, so a partial value that matches one is final
+_ROUTER_LABELS = frozenset(get_args(RouterDecision.model_fields["selected_agent"].annotation))
+
+
+async def _invoke_router(
+    messages: list[Any],
+    on_agent_selected: Optional[AgentSelectedCallback] = None
+) -> RouterDecision:
+    """
+    Stream the routing decision from the LLM.
+    
+    on_agent_selected fires as soon as selected_agent is decoded, while the
+    remaining fields (reasoning, collaboration) are still streaming.
+    """
+    parsed: Any = {}
+    notified = on_agent_selected is None
+    async for parsed in get_streaming_router_chain().astream(messages):
+        if notified or not isinstance(parsed, dict):
+            continue
+        selected = parsed.get("selected_agent")
+        if selected in _ROUTER_LABELS:
+            notified = True
+            try:
+                on_agent_selected(selected)
+            except Exception as e:
+                logger.warning("Early routing callback failed", error=str(e))
+    
+    return RouterDecision.model_validate(parsed)
+
+
 async def supervisor_node(state: CognitiveState) -> dict[str, Any]:
     """
     Supervisor node that routes messages to appropriate agents.
@@ -131,30 +523,54 @@ async def supervisor_node(state: CognitiveState) -> dict[str, Any]:
         agent=None
     )
     
-    # Get LLM with structured output
-    llm = get_supervisor_llm()
-    structured_llm = llm.with_structured_output(RouterDecision)
-    
     # Build messages
     messages = [
-        SystemMessage(content=SUPERVISOR_SYSTEM_PROMPT),
-        HumanMessage(content=f"""Analiza esta solicitud y decide el enrutamiento:
-
-{state.user_message}
-
-Considera:
-- OKRs alineados: {[str(okr) for okr in (state.okr_context.aligned_okr_ids if state.okr_context else [])]}
-- Agentes ya visitados en esta sesión: {[a.value if hasattr(a, 'value') else a for a in state.visited_agents]}
-""")
+        _SUPERVISOR_SYSMSG,
+        HumanMessage(content=_ROUTER_REQUEST_TEMPLATE.format(
+            okr_ids=state.okr_ids_str,
+            visited_agents=state.visited_agents_str,
+            user_message=state.user_message
+        ))
     ]
     
     try:
-        # Get routing decision
-        decision: RouterDecision = await structured_llm.ainvoke(messages)
+        # Get routing decision: exact cache match, local classifier, similar
+        # cache match, then LLM. The local classifier runs before the
+        # similarity lookup so locally routed messages never pay for an embedding.
+        settings = get_settings()
+        partition = (tuple(slot_value(a) for a in state.visited_agents), state.okr_ids_str)
+        decision = None
+        embedding = None
+        
+        if settings.supervisor_cache_enabled:
+            router_cache = get_router_cache()
+            decision = router_cache.get(state.user_message, partition)
+            source = "cache"
+        
+        if decision is None:
+            decision = await classify_locally(state.user_message)
+            source = "local"
+        
+        if decision is None and settings.supervisor_cache_enabled:
+            decision, embedding = await router_cache.lookup(state.user_message, partition)
+            source = "cache"
+        
+        cache_hit = source == "cache" and decision is not None
+        
+        if decision is None:
+            # Warm the predicted agent while the rest of the decision streams
+            from app.agents.prefetch import prefetch_agent_context
+            decision = await _invoke_router(
+                messages,
+                on_agent_selected=prefetch_agent_context
+            )
+            source = "llm"
+            if settings.supervisor_cache_enabled:
+                router_cache.store(state.user_message, partition, embedding, decision)
         
         # Log decision
         state.log_decision(
-            f"Routing to: {decision.selected_agent} (confidence: {decision.confidence:.2f}) - {decision.reasoning}"
+            f"Routing to: {decision.selected_agent} (confidence: {decision.confidence:.2f}, source: {source}, cache_hit: {cache_hit}) - {decision.reasoning}"
         )
         
         logger.info(
@@ -162,7 +578,9 @@ Considera:
             run_id=str(state.run_id),
             selected_agent=decision.selected_agent,
             confidence=decision.confidence,
-            requires_collaboration=decision.requires_collaboration
+            requires_collaboration=decision.requires_collaboration,
+            cache_hit=cache_hit,
+            source=source
         )
         
         # Determine next agent
@@ -229,7 +647,7 @@ def route_to_agent(state: CognitiveState) -> str:
     
     # Route to next agent
     if state.next_agent:
-        return state.next_agent.value if hasattr(state.next_agent, 'value') else state.next_agent
+        return slot_value(state.next_agent)
     
     # Default to end
     return "end"
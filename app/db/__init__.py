@@ -3,13 +3,31 @@
 from app.db.supabase import (
     get_supabase_client,
     get_supabase_admin_client,
+    get_async_supabase_client,
+    get_async_supabase_admin_client,
+    AsyncSupabaseProxy,
     supabase,
     supabase_admin
 )
+from app.db.postgres import (
+    init_pg_pool,
+    close_pg_pool,
+    get_pg_pool,
+    fetch_agent_by_id,
+    copy_brain_log,
+)
 
 __all__ = [
     "get_supabase_client",
     "get_supabase_admin_client",
+    "get_async_supabase_client",
+    "get_async_supabase_admin_client",
+    "AsyncSupabaseProxy",
     "supabase",
-    "supabase_admin"
+    "supabase_admin",
+    "init_pg_pool",
+    "close_pg_pool",
+    "get_pg_pool",
+    "fetch_agent_by_id",
+    "copy_brain_log",
 ]
@@ -5,10 +5,20 @@ Aligned with existing schema discovered in EAM COGNITIVE TEAM project
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+import numpy as np
+import orjson
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    WithJsonSchema,
+)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -90,12 +100,50 @@ class SenderType(str, Enum):
 # Base Model
 # ─────────────────────────────────────────────────────────────────────────────
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Vector Fields
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _to_vector(value: Any) -> np.ndarray:
+    """Coerce a pgvector value (ndarray, list or PostgREST text '[...]') to float32."""
+    if isinstance(value, (str, bytes)):
+        value = orjson.loads(value)
+    return np.asarray(value, dtype=np.float32)
+
+
+def vector_literal(embedding: Any) -> str:
+    """
+    Encode an embedding as pgvector text ('[...]') for PostgREST payloads.
+    supabase-py serializes JSON with the stdlib, which formats floats one by
+    one; a pre-encoded string is written as a single escaped value instead.
+    """
+    return orjson.dumps(
+        np.asarray(embedding, dtype=np.float32),
+        option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+# Embeddings held as contiguous float32 arrays instead of lists of boxed floats
+VectorField = Annotated[
+    np.ndarray,
+    PlainValidator(_to_vector),
+    PlainSerializer(lambda a: a.tolist()),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
 class DBBaseModel(BaseModel):
-    """Base for all database models with common config."""
+    """
+    Base for all database models with common config.
+    Rows are read-only snapshots; *Create schemas stay mutable BaseModels.
+    """
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        use_enum_values=True
+        use_enum_values=True,
+        frozen=True,
+        # Build validators at import time instead of on first use
+        defer_build=False
     )
 
 
@@ -219,7 +267,7 @@ class Objective(DBBaseModel):
     description: Optional[str] = None
     period: str
     progress: int = Field(default=0, ge=0, le=100)
-    embedding: Optional[list[float]] = None
+    embedding: Optional[VectorField] = None
     is_active: bool = True
     created_at: datetime
     updated_at: datetime
@@ -285,6 +333,7 @@ class BrainLogCreate(BaseModel):
     tool_output: Optional[Any] = None
     tokens_used: Optional[int] = None
     duration_ms: Optional[int] = None
+    created_at: Optional[datetime] = None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -296,7 +345,7 @@ class Memory(DBBaseModel):
     id: UUID
     agent_id: Optional[UUID] = None
     content: str
-    embedding: Optional[list[float]] = None
+    embedding: Optional[VectorField] = None
     memory_type: MemoryType
     importance: float = 0.5
     last_accessed: datetime
@@ -309,7 +358,7 @@ class MemoryCreate(BaseModel):
     """Schema for creating a memory."""
     agent_id: Optional[UUID] = None
     content: str
-    embedding: Optional[list[float]] = None
+    embedding: Optional[VectorField] = None
     memory_type: MemoryType
     importance: float = 0.5
     metadata: Optional[dict[str, Any]] = None
@@ -388,3 +437,17 @@ class AccessLog(DBBaseModel):
     device_verified: bool = False
     metadata: Optional[dict[str, Any]] = None
     created_at: datetime
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Type Adapters (bulk row hydration)
+# ─────────────────────────────────────────────────────────────────────────────
+
+HITL_REQUEST_LIST_ADAPTER = TypeAdapter(list[HITLRequest])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Column Lists (PostgREST selects matching a model)
+# ─────────────────────────────────────────────────────────────────────────────
+
+PROFILE_COLUMNS = ", ".join(Profile.model_fields)
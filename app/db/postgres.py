@@ -0,0 +1,149 @@
+"""
+Postgres Pool - Direct asyncpg access for server-side operations
+Bypasses PostgREST (HTTP + JSON) for system workflows. Keep supabase-py
+for user-facing operations that must respect RLS.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+import asyncpg
+import orjson
+import structlog
+from pgvector.asyncpg import register_vector
+
+from app.config import get_settings
+from app.db.models import Agent, BrainLogCreate
+
+logger = structlog.get_logger(__name__)
+
+_pool: Optional[asyncpg.Pool] = None
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Decode/encode json and jsonb columns as Python objects, vectors as ndarrays.
+    Binary codecs so the same values work with COPY (copy_records_to_table).
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=orjson.dumps,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="binary"
+    )
+    # jsonb binary wire format is a version byte (1) followed by the JSON text
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: b"\x01" + orjson.dumps(value),
+        decoder=lambda data: orjson.loads(data[1:]),
+        schema="pg_catalog",
+        format="binary"
+    )
+    # pgvector columns as float32 ndarrays (binary format)
+    await register_vector(conn)
+
+
+async def init_pg_pool() -> Optional[asyncpg.Pool]:
+    """
+    Create the process-wide connection pool.
+    Returns None when no database URL is configured.
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+    
+    settings = get_settings()
+    if not settings.supabase_db_url:
+        return None
+    
+    _pool = await asyncpg.create_pool(
+        dsn=settings.supabase_db_url.get_secret_value(),
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size,
+        statement_cache_size=256,
+        init=_init_connection
+    )
+    logger.info(
+        "Postgres pool created",
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size
+    )
+    return _pool
+
+
+async def close_pg_pool() -> None:
+    """Close the connection pool if it was created."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def get_pg_pool() -> Optional[asyncpg.Pool]:
+    """Get the connection pool (None if not configured or not started)."""
+    return _pool
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CRUD Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Rows are serialized to JSON text by Postgres and validated by pydantic-core
+# directly, skipping the intermediate Record -> dict conversion.
+async def fetch_agent_by_id(agent_id: UUID) -> Optional[Agent]:
+    """Fetch a single agent row by id."""
+    pool = get_pg_pool()
+    if pool is None:
+        raise RuntimeError("Postgres pool not initialized")
+    
+    raw = await pool.fetchval(
+        "SELECT row_to_json(agents)::text FROM agents WHERE id = $1",
+        agent_id
+    )
+    return Agent.model_validate_json(raw) if raw else None
+
+
+_BRAIN_LOG_COLUMNS = (
+    "run_id",
+    "step_type",
+    "content",
+    "tool_name",
+    "tool_input",
+    "tool_output",
+    "tokens_used",
+    "duration_ms",
+    "created_at",
+)
+
+
+def _brain_log_record(entry: BrainLogCreate) -> tuple[Any, ...]:
+    return (
+        entry.run_id,
+        getattr(entry.step_type, "value", entry.step_type),
+        entry.content,
+        entry.tool_name,
+        entry.tool_input,
+        entry.tool_output,
+        entry.tokens_used,
+        entry.duration_ms,
+        entry.created_at or datetime.now(timezone.utc),
+    )
+
+
+async def copy_brain_log(entries: list[BrainLogCreate]) -> int:
+    """Bulk-load brain log entries with the COPY protocol."""
+    if not entries:
+        return 0
+    
+    pool = get_pg_pool()
+    if pool is None:
+        raise RuntimeError("Postgres pool not initialized")
+    
+    await pool.copy_records_to_table(
+        "brain_log",
+        records=[_brain_log_record(e) for e in entries],
+        columns=list(_BRAIN_LOG_COLUMNS)
+    )
+    return len(entries)
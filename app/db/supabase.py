@@ -4,6 +4,9 @@ Compatible with supabase-py v2.x
 """
 
 from functools import lru_cache
+from typing import Any, Optional
+
+import anyio
 from supabase import create_client, Client
 
 from app.config import get_settings
@@ -35,6 +38,56 @@ def get_supabase_admin_client() -> Client:
     )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Async Access
+# ─────────────────────────────────────────────────────────────────────────────
+
+_thread_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_thread_limiter() -> anyio.CapacityLimiter:
+    """Dedicated limiter so DB calls don't exhaust the default threadpool."""
+    global _thread_limiter
+    if _thread_limiter is None:
+        _thread_limiter = anyio.CapacityLimiter(get_settings().supabase_thread_limit)
+    return _thread_limiter
+
+
+class AsyncSupabaseProxy:
+    """
+    Async facade over a synchronous supabase-py client.
+    
+    Query builders are plain Python and are built inline; only execute()
+    does blocking HTTP, so it runs in a worker thread:
+        
+        db = get_async_supabase_admin_client()
+        result = await db.execute(db.table("agents").select("id").limit(1))
+    """
+    
+    def __init__(self, client: Client):
+        self._client = client
+    
+    def __getattr__(self, name: str) -> Any:
+        # table(), rpc(), storage... return the client's builders unchanged
+        return getattr(self._client, name)
+    
+    async def execute(self, query: Any) -> Any:
+        """Run query.execute() off the event loop."""
+        return await anyio.to_thread.run_sync(query.execute, limiter=_get_thread_limiter())
+
+
+@lru_cache
+def get_async_supabase_client() -> AsyncSupabaseProxy:
+    """Async proxy over the anon-key client (respects RLS)."""
+    return AsyncSupabaseProxy(get_supabase_client())
+
+
+@lru_cache
+def get_async_supabase_admin_client() -> AsyncSupabaseProxy:
+    """Async proxy over the service-role client (bypasses RLS)."""
+    return AsyncSupabaseProxy(get_supabase_admin_client())
+
+
 # Convenience aliases
 supabase = get_supabase_client
 supabase_admin = get_supabase_admin_client
@@ -6,8 +6,11 @@ Armenia, Quindío, Colombia
 
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, Awaitable
+import asyncio
+import time
 
+import orjson
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,6 +21,25 @@ from app.config import get_settings
 from app.api.routes import chat, agents, runs, hitl, memory, pdi
 from app.api.websocket import router as websocket_router
 
+
+def _orjson_dumps(*args: Any, **kwargs: Any) -> str:
+    """orjson serializer for structlog's JSONRenderer (returns str, not bytes)."""
+    return orjson.dumps(*args, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
+_exception_renderer = structlog.processors.ExceptionRenderer(
+    structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+)
+
+
+def _render_exc_info(logger, method_name, event_dict):
+    """Render tracebacks only for records that carry exc_info."""
+    if event_dict.get("exc_info"):
+        return _exception_renderer(logger, method_name, event_dict)
+    event_dict.pop("exc_info", None)
+    return event_dict
+
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -26,10 +48,9 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
@@ -40,6 +61,14 @@ structlog.configure(
 logger = structlog.get_logger(__name__)
 
 
+async def _preload(step: Awaitable[Any], failure_message: str) -> None:
+    """Run an optional startup step; failures are logged, not raised."""
+    try:
+        await step
+    except Exception as e:
+        logger.warning(failure_message, error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -57,8 +86,36 @@ async def lifespan(app: FastAPI):
     get_cognitive_graph()
     logger.info("Cognitive graph compiled")
     
+    from app.db.postgres import init_pg_pool, close_pg_pool
+    from app.security.hitl import load_agent_ids
+    from app.security.zero_trust import load_jwks
+    from app.core.supervisor import load_local_router
+    
+    # Independent startup steps (Postgres, PostgREST, Auth, routing model):
+    # run them concurrently so their setup overlaps instead of adding up
+    await asyncio.gather(
+        # Direct Postgres pool for server-side queries (optional)
+        _preload(init_pg_pool(), "Postgres pool unavailable, using PostgREST only"),
+        # Agent name -> id map used by HITL requests
+        _preload(load_agent_ids(force=True), "Agent id preload failed"),
+        # Supabase Auth signing keys for local JWT verification
+        _preload(load_jwks(force=True), "JWKS preload failed"),
+        # Optional zero-shot routing model, loaded off the event loop
+        _preload(load_local_router(), "Local routing model preload failed"),
+    )
+    
     yield
     
+    # Drain queued background writes before exiting
+    from app.core.checkpointer import get_brain_log_writer
+    from app.security.audit import get_audit_queue
+    await get_brain_log_writer().drain()
+    await get_audit_queue().stop()
+    await close_pg_pool()
+    
+    from app.security.zero_trust import close_auth_http_client
+    await close_auth_http_client()
+    
     logger.info("EAM Cognitive OS shutting down")
 
 
@@ -106,14 +163,21 @@ app.add_middleware(
 # Request Logging Middleware
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Probe endpoints polled by orchestrators; not worth a log line each
+_UNLOGGED_PATHS = frozenset({"/health", "/health/ready", "/"})
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all HTTP requests."""
-    start_time = datetime.utcnow()
+    """Log all HTTP requests (except health probes)."""
+    if request.url.path in _UNLOGGED_PATHS:
+        return await call_next(request)
+    
+    start = time.perf_counter_ns()
     
     response = await call_next(request)
     
-    duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+    duration_ms = (time.perf_counter_ns() - start) // 1_000_000
     
     logger.info(
         "HTTP request",
@@ -121,7 +185,7 @@ async def log_requests(request: Request, call_next):
         path=request.url.path,
         status_code=response.status_code,
         duration_ms=duration_ms,
-        client=request.client.host if request.client else "unknown"
+        client=getattr(request.client, "host", "unknown")
     )
     
     return response
@@ -131,22 +195,53 @@ async def log_requests(request: Request, call_next):
 # Exception Handlers
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Full tracebacks are logged once per route per window; repeats are summarized
+_ERROR_LOG_WINDOW_SECONDS = 60.0
+_error_log_windows: dict[str, tuple[float, int]] = {}
+
+
+def _should_log_traceback(route_key: str) -> tuple[bool, int]:
+    """Return (log full traceback?, errors suppressed so far in this window)."""
+    now = time.monotonic()
+    window_start, count = _error_log_windows.get(route_key, (0.0, 0))
+    if now - window_start >= _ERROR_LOG_WINDOW_SECONDS:
+        _error_log_windows[route_key] = (now, 0)
+        return True, 0
+    _error_log_windows[route_key] = (window_start, count + 1)
+    return False, count + 1
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions."""
-    logger.error(
-        "Unhandled exception",
-        path=request.url.path,
-        method=request.method,
-        error=str(exc),
-        exc_info=True
-    )
+    exc_str = str(exc)
+    # Route template keeps the window table bounded (no path parameters)
+    route = request.scope.get("route")
+    route_key = getattr(route, "path", request.url.path)
+    
+    log_traceback, suppressed = _should_log_traceback(route_key)
+    if log_traceback:
+        logger.error(
+            "Unhandled exception",
+            path=request.url.path,
+            method=request.method,
+            error=exc_str,
+            exc_info=exc
+        )
+    else:
+        logger.warning(
+            "Unhandled exception (traceback rate-limited)",
+            path=request.url.path,
+            method=request.method,
+            error=exc_str,
+            suppressed=suppressed
+        )
     
     return JSONResponse(
         status_code=500,
         content={
             "error": "Error interno del servidor",
-            "detail": str(exc) if settings.debug else "Contacte al administrador"
+            "detail": exc_str if settings.debug else "Contacte al administrador"
         }
     )
 
@@ -168,7 +263,7 @@ app.include_router(websocket_router)
 # Health Check Endpoints
 # ─────────────────────────────────────────────────────────────────────────────
 
-@app.get("/health", tags=["Health"])
+@app.get("/health", tags=["Health"], include_in_schema=False)
 async def health_check() -> dict[str, Any]:
     """Basic health check."""
     return {
@@ -178,13 +273,14 @@ async def health_check() -> dict[str, Any]:
     }
 
 
-@app.get("/health/ready", tags=["Health"])
+@app.get("/health/ready", tags=["Health"], include_in_schema=False)
 async def readiness_check() -> dict[str, Any]:
     """
     Readiness check - verifies all dependencies.
     Returns 200 if ready to accept traffic.
     """
-    from app.db.supabase import get_supabase_client
+    from app.db.supabase import get_async_supabase_client
+    from app.db.postgres import get_pg_pool
     
     checks = {
         "database": False,
@@ -193,8 +289,13 @@ async def readiness_check() -> dict[str, Any]:
     
     # Check Supabase connection
     try:
-        client = get_supabase_client()
-        client.table("agents").select("id").limit(1).execute()
+        pool = get_pg_pool()
+        if pool is not None:
+            await pool.fetchval("SELECT 1")
+        else:
+            db = get_async_supabase_client()
+            # HEAD request: status and headers only, no row body to parse
+            await db.execute(db.table("agents").select("id", head=True).limit(1))
         checks["database"] = True
     except Exception as e:
         logger.warning("Database health check failed", error=str(e))
@@ -220,7 +321,7 @@ async def readiness_check() -> dict[str, Any]:
     )
 
 
-@app.get("/", tags=["Root"])
+@app.get("/", tags=["Root"], include_in_schema=False)
 async def root() -> dict[str, Any]:
     """Root endpoint with API info."""
     return {
@@ -10,11 +10,15 @@ from app.protocols.genui import (
     ProgressPayload,
     create_genui_payload,
     genui_card,
+    genui_card_bytes,
     genui_table,
     genui_chart,
     genui_hitl,
     genui_progress,
+    encode_sse_event,
     stream_genui_payloads,
+    genui_response,
+    genui_stream_response,
 )
 
 __all__ = [
@@ -27,9 +31,13 @@ __all__ = [
     "ProgressPayload",
     "create_genui_payload",
     "genui_card",
+    "genui_card_bytes",
     "genui_table",
     "genui_chart",
     "genui_hitl",
     "genui_progress",
+    "encode_sse_event",
     "stream_genui_payloads",
+    "genui_response",
+    "genui_stream_response",
 ]
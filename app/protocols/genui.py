@@ -2,10 +2,13 @@
 GenUI Protocol - Generative UI component streaming
 """
 
+from functools import lru_cache
 from typing import Any, AsyncGenerator
 from enum import Enum
-import json
+import asyncio
 
+import orjson
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.core.state import GenUIPayload
@@ -24,6 +27,9 @@ class GenUIComponent(str, Enum):
     MARKDOWN = "markdown"
 
 
+# Payload models document the frontend contract. The genui_* factories below
+# build the same dicts directly instead of validating arguments they shaped.
+
 class CardPayload(BaseModel):
     """Payload for card component."""
     title: str
@@ -89,7 +95,8 @@ def create_genui_payload(
     Returns:
         GenUI payload ready for streaming
     """
-    return GenUIPayload(
+    # Arguments are already typed by the factories; skip re-validation
+    return GenUIPayload.model_construct(
         component=component.value,
         data=data,
         metadata=metadata
@@ -106,16 +113,48 @@ def genui_card(
     """Create a card component payload."""
     return create_genui_payload(
         GenUIComponent.CARD,
-        CardPayload(
-            title=title,
-            content=content,
-            icon=icon,
-            variant=variant,
-            actions=actions or []
-        ).model_dump()
+        {
+            "title": title,
+            "content": content,
+            "icon": icon,
+            "variant": variant,
+            "actions": actions or []
+        }
     )
 
 
+# Cards built from static copy (fixed titles, icons, actions) repeat often;
+# their encoded form is cached per unique argument set.
+
+@lru_cache(maxsize=1024)
+def _cached_card_bytes(
+    title: str,
+    content: str,
+    icon: str,
+    variant: str,
+    actions_key: tuple[tuple[tuple[str, str], ...], ...]
+) -> bytes:
+    payload = genui_card(title, content, icon, variant, [dict(a) for a in actions_key])
+    return orjson.dumps(payload.model_dump())
+
+
+def genui_card_bytes(
+    title: str,
+    content: str,
+    icon: str = "📋",
+    variant: str = "default",
+    actions: list[dict[str, str]] | None = None
+) -> bytes:
+    """
+    Create a card component payload already encoded as JSON.
+    
+    For callers whose card content is immutable: repeated calls with the
+    same arguments return the cached bytes without rebuilding the payload.
+    """
+    actions_key = tuple(tuple(a.items()) for a in actions or ())
+    return _cached_card_bytes(title, content, icon, variant, actions_key)
+
+
 def genui_table(
     columns: list[dict[str, str]],
     rows: list[dict[str, Any]],
@@ -124,11 +163,12 @@ def genui_table(
     """Create a table component payload."""
     return create_genui_payload(
         GenUIComponent.TABLE,
-        TablePayload(
-            columns=columns,
-            rows=rows,
-            title=title
-        ).model_dump()
+        {
+            "columns": columns,
+            "rows": rows,
+            "title": title,
+            "sortable": True
+        }
     )
 
 
@@ -142,13 +182,13 @@ def genui_chart(
     """Create a chart component payload."""
     return create_genui_payload(
         GenUIComponent.CHART,
-        ChartPayload(
-            chart_type=chart_type,
-            data=data,
-            x_key=x_key,
-            y_keys=y_keys,
-            title=title
-        ).model_dump()
+        {
+            "chart_type": chart_type,
+            "data": data,
+            "x_key": x_key,
+            "y_keys": y_keys,
+            "title": title
+        }
     )
 
 
@@ -162,13 +202,13 @@ def genui_hitl(
     """Create a HITL approval component payload."""
     return create_genui_payload(
         GenUIComponent.HITL,
-        HITLPayload(
-            request_id=request_id,
-            reason=reason,
-            context=context,
-            proposed_action=proposed_action,
-            expires_at=expires_at
-        ).model_dump()
+        {
+            "request_id": request_id,
+            "reason": reason,
+            "context": context,
+            "proposed_action": proposed_action,
+            "expires_at": expires_at
+        }
     )
 
 
@@ -180,26 +220,96 @@ def genui_progress(
     """Create a progress indicator payload."""
     return create_genui_payload(
         GenUIComponent.PROGRESS,
-        ProgressPayload(
-            current=current,
-            total=total,
-            label=label
-        ).model_dump()
+        {
+            "current": current,
+            "total": total,
+            "label": label,
+            "variant": "default"
+        }
     )
 
 
+# Coalesce small SSE frames into writes of roughly this size
+SSE_BATCH_BYTES = 8192
+
+# SSE framing, pre-encoded so frames are built by bytes concatenation
+_SSE_GENUI_PREFIX = b"event: genui\ndata: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def encode_sse_event(event: str, data: Any) -> bytes:
+    """Encode one Server-Sent Event frame with an orjson data line."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data, default=str) + _SSE_SUFFIX
+
+
 async def stream_genui_payloads(
-    payloads: list[GenUIPayload]
-) -> AsyncGenerator[str, None]:
+    payloads: list[GenUIPayload],
+    batch_bytes: int = SSE_BATCH_BYTES
+) -> AsyncGenerator[bytes, None]:
     """
     Stream GenUI payloads as Server-Sent Events.
     
+    Consecutive frames are concatenated into one chunk of up to batch_bytes
+    (a single frame may exceed it), so many small payloads cost one ASGI
+    send instead of one per event. Clients parse the frames unchanged.
+    
+    Kept async-native on purpose: Starlette iterates sync generators
+    through the threadpool.
+    
     Args:
         payloads: List of GenUI payloads to stream
+        batch_bytes: Flush threshold for a batched chunk
         
     Yields:
-        SSE-formatted event strings
+        SSE-formatted events, already encoded (Starlette sends bytes as-is)
+    """
+    buffer = bytearray()
+    for i, payload in enumerate(payloads):
+        buffer += _SSE_GENUI_PREFIX
+        buffer += orjson.dumps(payload.model_dump(), default=str)
+        buffer += _SSE_SUFFIX
+        if len(buffer) >= batch_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+        if i % 32 == 31:
+            # Encoding is CPU-only; let other tasks run on long payload lists
+            await asyncio.sleep(0)
+    
+    if buffer:
+        yield bytes(buffer)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pre-serialized Responses (preferred for FastAPI handlers)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def genui_response(
+    component: GenUIComponent,
+    data: dict[str, Any],
+    metadata: dict[str, Any] | None = None,
+    status_code: int = 200
+) -> Response:
+    """
+    Return a GenUI payload as a ready JSON response.
+    
+    The body is encoded with orjson here, so FastAPI skips jsonable_encoder
+    and response-model serialization for it.
     """
-    for payload in payloads:
-        event_data = json.dumps(payload.model_dump())
-        yield f"event: genui\ndata: {event_data}\n\n"
+    payload = create_genui_payload(component, data, metadata)
+    return Response(
+        content=orjson.dumps(payload.model_dump(), default=str),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def genui_stream_response(payloads: list[GenUIPayload]) -> StreamingResponse:
+    """Return GenUI payloads as a Server-Sent Events response."""
+    return StreamingResponse(
+        stream_genui_payloads(payloads),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
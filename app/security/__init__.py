@@ -5,6 +5,7 @@ from app.security.hitl import (
     get_pending_hitl_requests,
     review_hitl_request,
     resume_after_hitl,
+    load_agent_ids,
 )
 from app.security.zero_trust import (
     ZeroTrustValidator,
@@ -12,11 +13,19 @@ from app.security.zero_trust import (
     build_security_context,
     require_access_level,
     require_auth,
+    load_jwks,
+    get_auth_http_client,
+    close_auth_http_client,
+    ProfileLoader,
+    get_profile_loader,
 )
 from app.security.audit import (
     log_access,
+    enqueue_access_log,
     log_security_event,
     AuditContext,
+    AuditLogQueue,
+    get_audit_queue,
 )
 
 __all__ = [
@@ -24,12 +33,21 @@ __all__ = [
     "get_pending_hitl_requests",
     "review_hitl_request",
     "resume_after_hitl",
+    "load_agent_ids",
     "ZeroTrustValidator",
     "get_current_user",
     "build_security_context",
     "require_access_level",
     "require_auth",
+    "load_jwks",
+    "get_auth_http_client",
+    "close_auth_http_client",
+    "ProfileLoader",
+    "get_profile_loader",
     "log_access",
+    "enqueue_access_log",
     "log_security_event",
     "AuditContext",
+    "AuditLogQueue",
+    "get_audit_queue",
 ]
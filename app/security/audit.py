@@ -2,29 +2,128 @@
 Audit Logging - Security event tracking
 """
 
-from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
+import asyncio
+import time
 
 import structlog
 from fastapi import Request
 
-from app.db.supabase import get_supabase_admin_client
-from app.db.models import AccessLog, AccessLevel
+from app.db.supabase import get_async_supabase_admin_client
+from app.db.models import AccessLevel
 from app.core.state import SecurityContext
 
 logger = structlog.get_logger(__name__)
 
 
-async def log_access(
+# ─────────────────────────────────────────────────────────────────────────────
+# Batched Writes
+# ─────────────────────────────────────────────────────────────────────────────
+
+class AuditLogQueue:
+    """
+    In-memory queue of access_logs rows flushed in batches.
+    
+    A background task collects up to max_batch rows (or whatever arrives
+    within max_wait seconds) and writes them with a single insert, so
+    callers never wait on the database.
+    """
+    
+    def __init__(
+        self,
+        max_batch: int = 100,
+        max_wait: float = 0.2,
+        max_queue_size: int = 10_000
+    ):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+    
+    def put(self, row: dict[str, Any]) -> None:
+        """Queue a row for the next batch."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.error("Audit queue full, dropping access log", action=row.get("action"))
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._insert(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    async def _insert(self, batch: list[dict[str, Any]]) -> None:
+        # Access and security-event rows carry different columns; a bulk insert
+        # needs uniform keys, so write one insert per column set
+        groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for row in batch:
+            groups.setdefault(frozenset(row), []).append(row)
+        
+        db = get_async_supabase_admin_client()
+        for rows in groups.values():
+            try:
+                await db.execute(db.table("access_logs").insert(rows))
+                logger.debug("Access logs flushed", rows=len(rows))
+            except Exception as e:
+                logger.error("Failed to flush access logs", rows=len(rows), error=str(e))
+    
+    async def stop(self) -> None:
+        """Flush queued rows and stop the background task."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+_audit_queue: Optional[AuditLogQueue] = None
+
+
+def get_audit_queue() -> AuditLogQueue:
+    """Get or create the process-wide audit queue."""
+    global _audit_queue
+    if _audit_queue is None:
+        _audit_queue = AuditLogQueue()
+    return _audit_queue
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Audit API
+# ─────────────────────────────────────────────────────────────────────────────
+
+def enqueue_access_log(
     action: str,
     security_context: SecurityContext,
     resource_type: Optional[str] = None,
     resource_id: Optional[UUID] = None,
     metadata: Optional[dict[str, Any]] = None
-) -> Optional[AccessLog]:
+) -> None:
     """
-    Log an access event to the audit trail.
+    Queue an access event for the audit trail without awaiting anything.
     
     Args:
         action: The action performed (e.g., 'chat.send', 'agent.invoke')
@@ -32,14 +131,9 @@ async def log_access(
         resource_type: Type of resource accessed (optional)
         resource_id: ID of resource accessed (optional)
         metadata: Additional metadata (optional)
-        
-    Returns:
-        Created access log entry or None
     """
-    client = get_supabase_admin_client()
-    
     log_data = {
-        "user_id": str(security_context.user_id) if security_context.user_id != UUID(int=0) else None,
+        "user_id": None if security_context.is_anonymous else security_context.user_id,
         "action": action,
         "resource_type": resource_type,
         "resource_id": str(resource_id) if resource_id else None,
@@ -50,25 +144,26 @@ async def log_access(
         "metadata": metadata
     }
     
-    try:
-        result = client.table("access_logs").insert(log_data).execute()
-        
-        if result.data:
-            logger.debug(
-                "Access logged",
-                action=action,
-                user_id=str(security_context.user_id)
-            )
-            return AccessLog(**result.data[0])
-        
-    except Exception as e:
-        logger.error(
-            "Failed to log access",
-            action=action,
-            error=str(e)
-        )
-    
-    return None
+    get_audit_queue().put(log_data)
+    logger.debug(
+        "Access logged",
+        action=action,
+        user_id=str(security_context.user_id)
+    )
+
+
+async def log_access(
+    action: str,
+    security_context: SecurityContext,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[UUID] = None,
+    metadata: Optional[dict[str, Any]] = None
+) -> None:
+    """
+    Log an access event to the audit trail.
+    The row is queued and written in the next batch (see enqueue_access_log).
+    """
+    enqueue_access_log(action, security_context, resource_type, resource_id, metadata)
 
 
 async def log_security_event(
@@ -80,6 +175,7 @@ async def log_security_event(
 ) -> None:
     """
     Log a security-related event.
+    The row is queued with access logs and written in the next batch.
     
     Args:
         event_type: Type of event (auth_failure, suspicious_activity, etc.)
@@ -88,8 +184,6 @@ async def log_security_event(
         request: FastAPI request object
         metadata: Additional data
     """
-    client = get_supabase_admin_client()
-    
     log_data = {
         "action": f"security.{event_type}",
         "ip_address": request.client.host if request.client else None,
@@ -101,23 +195,15 @@ async def log_security_event(
         }
     }
     
-    try:
-        client.table("access_logs").insert(log_data).execute()
-        
-        # Also log to structured logger
-        log_method = getattr(logger, severity, logger.info)
-        log_method(
-            f"Security event: {event_type}",
-            description=description,
-            ip=request.client.host if request.client else "unknown"
-        )
-        
-    except Exception as e:
-        logger.error(
-            "Failed to log security event",
-            event_type=event_type,
-            error=str(e)
-        )
+    get_audit_queue().put(log_data)
+    
+    # Also log to structured logger
+    log_method = getattr(logger, severity, logger.info)
+    log_method(
+        f"Security event: {event_type}",
+        description=description,
+        ip=request.client.host if request.client else "unknown"
+    )
 
 
 class AuditContext:
@@ -134,15 +220,15 @@ class AuditContext:
         self.security_context = security_context
         self.resource_type = resource_type
         self.resource_id = resource_id
-        self.start_time = None
+        self.start_ns: Optional[int] = None
         self.metadata: dict[str, Any] = {}
     
     async def __aenter__(self):
-        self.start_time = datetime.utcnow()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = int((datetime.utcnow() - self.start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - self.start_ns) // 1_000_000
         self.metadata["duration_ms"] = duration_ms
         
         if exc_type:
@@ -151,7 +237,8 @@ class AuditContext:
         else:
             self.metadata["success"] = True
         
-        await log_access(
+        # Queued for the background batch writer; the response doesn't wait on it
+        enqueue_access_log(
             action=self.action,
             security_context=self.security_context,
             resource_type=self.resource_type,
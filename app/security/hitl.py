@@ -2,80 +2,126 @@
 HITL Manager - Human-in-the-Loop approval system
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from uuid import UUID
+import asyncio
+import time
 
 import structlog
 
-from app.db.supabase import get_supabase_admin_client
-from app.db.models import HITLRequest, HITLStatus
-from app.core.state import CognitiveState
+from app.db.supabase import get_async_supabase_admin_client
+from app.db.models import HITLRequest, HITLStatus, HITL_REQUEST_LIST_ADAPTER
+from app.core.state import CognitiveState, slot_value
 from app.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
 
-async def create_hitl_request(state: CognitiveState) -> Optional[HITLRequest]:
-    """
-    Create a HITL approval request in the database.
-    
-    Args:
-        state: Current cognitive state with HITL info
-        
-    Returns:
-        Created HITL request or None on failure
-    """
-    if not state.requires_hitl or not state.hitl_reason:
-        return None
-    
+def _build_hitl_request_data(state: CognitiveState) -> dict[str, Any]:
+    """Build the hitl_requests row for a state."""
     settings = get_settings()
-    client = get_supabase_admin_client()
     
-    # Determine which agent requested (use last visited)
-    requested_by = None
-    if state.visited_agents:
-        # Get agent ID from database by slot name
-        agent_slot = state.visited_agents[-1]
-        slot_value = agent_slot.value if hasattr(agent_slot, 'value') else agent_slot
-        result = client.table("agents").select("id").eq("name", slot_value.capitalize()).single().execute()
-        if result.data:
-            requested_by = result.data["id"]
-    
-    if not requested_by:
-        # Default to first agent
-        result = client.table("agents").select("id").limit(1).single().execute()
-        requested_by = result.data["id"] if result.data else None
-    
-    # Build request data
-    request_data = {
+    return {
         "run_id": str(state.run_id),
-        "requested_by": requested_by,
         "reason": state.hitl_reason,
         "context": {
             "user_message": state.user_message,
-            "visited_agents": [a.value if hasattr(a, 'value') else a for a in state.visited_agents],
+            "visited_agents": list(map(slot_value, state.visited_agents)),
             "current_response": state.current_response,
-            "okr_context": state.okr_context.model_dump() if state.okr_context else None
+            "okr_context": state.okr_context.model_dump(mode="json") if state.okr_context else None
         },
         "proposed_action": {
             "response": state.current_response,
             "brain_log_summary": [e.content for e in state.brain_log[-5:]]
         },
         "status": "pending",
-        "expires_at": (datetime.utcnow() + timedelta(hours=settings.hitl_timeout_hours)).isoformat()
+        "expires_at": (datetime.now(timezone.utc) + timedelta(hours=settings.hitl_timeout_hours)).isoformat()
     }
+
+
+def _last_visited_slot(state: CognitiveState) -> Optional[str]:
+    """Slot name of the last visited agent (the one requesting approval)."""
+    if not state.visited_agents:
+        return None
+    return slot_value(state.visited_agents[-1])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Agent Id Cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+AGENT_ID_CACHE_TTL_SECONDS = 300.0
+
+# agents.name -> agents.id, plus the first row as the default requester
+_agent_ids: dict[str, str] = {}
+_default_agent_id: Optional[str] = None
+_agent_ids_loaded_at = 0.0
+_agent_ids_lock = asyncio.Lock()
+
+
+async def load_agent_ids(force: bool = False) -> None:
+    """Load the agent name -> id map (called at startup, refreshed on TTL)."""
+    global _default_agent_id, _agent_ids_loaded_at
+    async with _agent_ids_lock:
+        if not force and time.monotonic() - _agent_ids_loaded_at < AGENT_ID_CACHE_TTL_SECONDS:
+            return
+        
+        db = get_async_supabase_admin_client()
+        result = await db.execute(db.table("agents").select("id, name"))
+        rows = result.data or []
+        
+        _agent_ids.clear()
+        _agent_ids.update({row["name"]: row["id"] for row in rows})
+        _default_agent_id = rows[0]["id"] if rows else None
+        _agent_ids_loaded_at = time.monotonic()
+
+
+async def _resolve_requesting_agent(agent_slot: Optional[str]) -> Optional[str]:
+    """Resolve the agents.id for a slot name, defaulting to the first agent."""
+    await load_agent_ids()
+    
+    requested_by = None
+    if agent_slot:
+        name = agent_slot.capitalize()
+        requested_by = _agent_ids.get(name)
+        if requested_by is None:
+            # Agent added since the last refresh
+            db = get_async_supabase_admin_client()
+            result = await db.execute(db.table("agents").select("id").eq("name", name).limit(1))
+            if result.data:
+                requested_by = _agent_ids[name] = result.data[0]["id"]
+    
+    return requested_by or _default_agent_id
+
+
+async def create_hitl_request(state: CognitiveState) -> Optional[HITLRequest]:
+    """
+    Create a HITL approval request in the database.
+    
+    Args:
+        state: Current cognitive state with HITL info
+        
+    Returns:
+        Created HITL request or None on failure
+    """
+    if not state.requires_hitl or not state.hitl_reason:
+        return None
+    
+    db = get_async_supabase_admin_client()
+    request_data = _build_hitl_request_data(state)
     
     try:
-        result = client.table("hitl_requests").insert(request_data).execute()
+        request_data["requested_by"] = await _resolve_requesting_agent(_last_visited_slot(state))
+        result = await db.execute(db.table("hitl_requests").insert(request_data))
         
         if result.data:
             logger.info(
                 "HITL request created",
                 request_id=result.data[0]["id"],
-                reason=state.hitl_reason
+                reason=request_data["reason"]
             )
-            return HITLRequest(**result.data[0])
+            return HITLRequest.model_validate(result.data[0])
         
     except Exception as e:
         logger.error("Failed to create HITL request", error=str(e))
@@ -83,18 +129,25 @@ async def create_hitl_request(state: CognitiveState) -> Optional[HITLRequest]:
     return None
 
 
+# Columns backing HITLRequest (avoids select("*") on the list endpoint)
+_HITL_REQUEST_COLUMNS = (
+    "id, run_id, requested_by, reason, context, proposed_action, status, "
+    "reviewed_by, review_notes, created_at, reviewed_at, expires_at"
+)
+
+
 async def get_pending_hitl_requests(limit: int = 10) -> list[HITLRequest]:
     """Get pending HITL requests."""
-    client = get_supabase_admin_client()
+    db = get_async_supabase_admin_client()
     
     try:
-        result = client.table("hitl_requests").select("*").eq(
+        result = await db.execute(db.table("hitl_requests").select(_HITL_REQUEST_COLUMNS).eq(
             "status", "pending"
         ).gt(
-            "expires_at", datetime.utcnow().isoformat()
-        ).order("created_at", desc=True).limit(limit).execute()
+            "expires_at", datetime.now(timezone.utc).isoformat()
+        ).order("created_at", desc=True).limit(limit))
         
-        return [HITLRequest(**r) for r in (result.data or [])]
+        return HITL_REQUEST_LIST_ADAPTER.validate_python(result.data or [])
         
     except Exception as e:
         logger.error("Failed to get pending HITL requests", error=str(e))
@@ -119,19 +172,19 @@ async def review_hitl_request(
     Returns:
         Updated HITL request or None
     """
-    client = get_supabase_admin_client()
+    db = get_async_supabase_admin_client()
     
     update_data = {
         "status": status,
         "reviewed_by": str(reviewer_id),
         "review_notes": notes,
-        "reviewed_at": datetime.utcnow().isoformat()
+        "reviewed_at": datetime.now(timezone.utc).isoformat()
     }
     
     try:
-        result = client.table("hitl_requests").update(update_data).eq(
+        result = await db.execute(db.table("hitl_requests").update(update_data).eq(
             "id", str(request_id)
-        ).execute()
+        ))
         
         if result.data:
             logger.info(
@@ -140,7 +193,7 @@ async def review_hitl_request(
                 status=status,
                 reviewer=str(reviewer_id)
             )
-            return HITLRequest(**result.data[0])
+            return HITLRequest.model_validate(result.data[0])
         
     except Exception as e:
         logger.error(
@@ -162,14 +215,15 @@ async def resume_after_hitl(request_id: UUID) -> Optional[dict[str, Any]]:
     Returns:
         Execution result or None
     """
-    client = get_supabase_admin_client()
+    db = get_async_supabase_admin_client()
     
     # Get the HITL request
-    result = client.table("hitl_requests").select("*").eq(
-        "id", str(request_id)
-    ).single().execute()
+    result = await db.execute(db.table("hitl_requests").select(
+        "run_id, status, proposed_action"
+    ).eq("id", str(request_id)).maybe_single())
     
-    if not result.data:
+    # maybe_single() returns None (instead of raising) when no row matches
+    if result is None or not result.data:
         logger.error("HITL request not found", request_id=str(request_id))
         return None
     
@@ -2,24 +2,82 @@
 Zero Trust Middleware - Security validation for all requests
 """
 
-from datetime import datetime
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from ipaddress import ip_address, ip_network
+from typing import Any, Optional
 from uuid import UUID
+import asyncio
+import base64
+import hashlib
+import logging
+import time
 
+import httpx
+import jwt
+import orjson
 import structlog
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import TypeAdapter
 from supabase import Client
 
-from app.db.supabase import get_supabase_client
-from app.db.models import AccessLevel, Profile
+from app.db.supabase import get_async_supabase_admin_client, get_supabase_client
+from app.db.models import PROFILE_COLUMNS, AccessLevel, Profile
 from app.core.state import SecurityContext
 from app.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Level check for per-request success logs: stdlib caches isEnabledFor, so
+# a disabled debug line costs one call instead of a structlog event
+_log_level_check = logging.getLogger(__name__)
+
 security = HTTPBearer(auto_error=False)
 
+# Placeholder user/session id for anonymous requests
+_NIL_ID = str(UUID(int=0))
+
+# Access levels from least to most trusted
+_LEVEL_RANK: dict[AccessLevel, int] = {
+    AccessLevel.EXTERNO: 0,
+    AccessLevel.VPN_INSTITUCIONAL: 1,
+    AccessLevel.SEDE_PRINCIPAL: 2
+}
+
+
+# Institutional networks, parsed once at import
+_TRUSTED_NETS = (
+    ip_network("192.168.0.0/16"),
+    ip_network("127.0.0.0/8"),
+    ip_network("::1/128"),
+)
+_VPN_NETS = (
+    ip_network("10.0.0.0/16"),
+)
+_VPN_FORWARD_HOST = "vpn.eam.edu.co"
+
+
+@lru_cache(maxsize=4096)
+def _network_access_level(host: Optional[str]) -> Optional[AccessLevel]:
+    """
+    Access level granted by the client's network alone (None if untrusted).
+    Cached per host: clients repeat, and parsing + membership tests are pure.
+    """
+    if not host:
+        return None
+    try:
+        client_ip = ip_address(host)
+    except ValueError:
+        # Hostnames / unknown formats
+        return None
+    if any(client_ip in net for net in _TRUSTED_NETS):
+        return AccessLevel.SEDE_PRINCIPAL
+    if any(client_ip in net for net in _VPN_NETS):
+        return AccessLevel.VPN_INSTITUCIONAL
+    return None
+
 
 class ZeroTrustValidator:
     """
@@ -39,22 +97,30 @@ class ZeroTrustValidator:
         
         Args:
             request: FastAPI request object
-            
+        
         Returns:
             Appropriate access level
         """
-        client_host = request.client.host if request.client else "unknown"
+        cached = getattr(request.state, "access_level", None)
+        if cached is not None:
+            return cached
         
-        # Check for institutional network ranges (mock implementation)
-        if client_host.startswith("192.168.") or client_host == "127.0.0.1":
-            return AccessLevel.SEDE_PRINCIPAL
+        network_level = _network_access_level(request.client.host if request.client else None)
         
-        # Check for VPN headers
-        forwarded = request.headers.get("X-Forwarded-For", "")
-        if "vpn.eam.edu.co" in forwarded or "10.0." in client_host:
-            return AccessLevel.VPN_INSTITUCIONAL
+        # Check for institutional network ranges (mock implementation)
+        if network_level is AccessLevel.SEDE_PRINCIPAL:
+            level = AccessLevel.SEDE_PRINCIPAL
+        # Check for VPN range, then VPN headers (scanned only when present)
+        elif network_level is AccessLevel.VPN_INSTITUCIONAL or _VPN_FORWARD_HOST in (
+            request.headers.get("X-Forwarded-For") or ""
+        ):
+            level = AccessLevel.VPN_INSTITUCIONAL
+        else:
+            level = AccessLevel.EXTERNO
         
-        return AccessLevel.EXTERNO
+        # Resolved once per request (security context and access checks share it)
+        request.state.access_level = level
+        return level
     
     @staticmethod
     def verify_device(request: Request) -> bool:
@@ -63,7 +129,7 @@ class ZeroTrustValidator:
         
         Args:
             request: FastAPI request object
-            
+        
         Returns:
             True if device is verified
         """
@@ -74,113 +140,459 @@ class ZeroTrustValidator:
         return device_token is not None and len(device_token) > 10
 
 
-async def get_current_user(
-    request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> Optional[Profile]:
+# ─────────────────────────────────────────────────────────────────────────────
+# Auth HTTP Client
+# ─────────────────────────────────────────────────────────────────────────────
+
+_auth_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_auth_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled client for Supabase Auth (JWKS, /auth/v1/user)."""
+    global _auth_http_client
+    if _auth_http_client is None or _auth_http_client.is_closed:
+        _auth_http_client = httpx.AsyncClient(
+            base_url=get_settings().supabase_url,
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+    return _auth_http_client
+
+
+async def close_auth_http_client() -> None:
+    """Close the pooled client if it was created."""
+    global _auth_http_client
+    if _auth_http_client is not None:
+        await _auth_http_client.aclose()
+        _auth_http_client = None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Local JWT Verification
+# ─────────────────────────────────────────────────────────────────────────────
+
+JWKS_CACHE_TTL_SECONDS = 600.0
+_ASYMMETRIC_ALGORITHMS = frozenset({"ES256", "RS256"})
+
+# Asymmetric signing keys published by Supabase Auth, by kid
+_jwks: dict[str, jwt.PyJWK] = {}
+_jwks_loaded_at = 0.0
+_jwks_lock = asyncio.Lock()
+
+
+async def load_jwks(force: bool = False) -> None:
+    """Fetch the project's JWKS (called at startup, refreshed on TTL or unknown kid)."""
+    global _jwks_loaded_at
+    async with _jwks_lock:
+        if not force and time.monotonic() - _jwks_loaded_at < JWKS_CACHE_TTL_SECONDS:
+            return
+        
+        resp = await get_auth_http_client().get("/auth/v1/.well-known/jwks.json")
+        resp.raise_for_status()
+        
+        keys = jwt.PyJWKSet.from_dict(orjson.loads(resp.content)).keys
+        _jwks.clear()
+        _jwks.update({key.key_id: key for key in keys if key.key_id})
+        _jwks_loaded_at = time.monotonic()
+        logger.info("JWKS loaded", count=len(_jwks))
+
+
+async def _get_jwk(kid: Optional[str]) -> Optional[jwt.PyJWK]:
+    if not kid:
+        return None
+    try:
+        await load_jwks()
+        if kid not in _jwks:
+            # Key rotated since the last fetch
+            await load_jwks(force=True)
+    except Exception as e:
+        logger.warning("JWKS fetch failed", error=str(e))
+    return _jwks.get(kid)
+
+
+@lru_cache
+def _hs256_keys() -> tuple[bytes, ...]:
+    """JWT secret as configured, then base64-decoded (both forms are in use)."""
+    secret = get_settings().supabase_jwt_secret
+    if not secret:
+        return ()
+    raw = secret.get_secret_value()
+    keys = [raw.encode("utf-8")]
+    try:
+        keys.append(base64.b64decode(raw))
+    except ValueError:
+        pass
+    return tuple(keys)
+
+
+# Secret form that verified a real token; later tokens use only this key
+_hs256_key: Optional[bytes] = None
+
+
+def _verify_hs256(token: str) -> Optional[dict[str, Any]]:
     """
-    Get current authenticated user from Supabase JWT.
-    Supports both legacy HS256 (Shared Secret) and modern ES256 (ECC) tokens.
+    Verify with the pinned secret form, probing both forms until one matches.
+    
+    Once a secret form is pinned it is known to be the project's, so a
+    signature mismatch is definite and raises. Before that, a mismatch may
+    mean a misconfigured secret, so None defers the token to Supabase Auth.
     """
-    if not credentials:
+    global _hs256_key
+    if _hs256_key is not None:
+        return jwt.decode(token, _hs256_key, algorithms=["HS256"], audience="authenticated")
+    
+    for key in _hs256_keys():
+        try:
+            payload = jwt.decode(token, key, algorithms=["HS256"], audience="authenticated")
+        except jwt.InvalidSignatureError:
+            continue
+        _hs256_key = key
+        return payload
+    return None
+
+
+async def _verify_token_locally(token: str) -> Optional[dict[str, Any]]:
+    """
+    Verify a Supabase access token without calling Auth.
+    
+    Returns:
+        The verified claims, or None if no local key can check the token
+    
+    Raises:
+        jwt.PyJWTError: The token was checked and is invalid or expired
+    """
+    header = jwt.get_unverified_header(token)
+    alg = header.get("alg")
+    
+    if alg == "HS256":
+        return _verify_hs256(token)
+    
+    if alg in _ASYMMETRIC_ALGORITHMS:
+        jwk = await _get_jwk(header.get("kid"))
+        if jwk is None:
+            return None
+        return jwt.decode(token, jwk.key, algorithms=[alg], audience="authenticated")
+    
+    return None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Authentication Caches
+# ─────────────────────────────────────────────────────────────────────────────
+
+TOKEN_CACHE_TTL_SECONDS = 300.0
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+PROFILE_CACHE_TTL_SECONDS = 60.0
+PROFILE_CACHE_MAX_ENTRIES = 10_000
+
+# blake2b(token) -> (monotonic expiry, user id); raw tokens are never stored.
+# Only successful verifications are cached.
+_token_cache: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+
+# blake2b(token) -> (monotonic expiry, (ETag, user id)) from /auth/v1/user,
+# kept until the token expires so revalidations can be conditional
+_auth_etags: OrderedDict[bytes, tuple[float, tuple[str, str]]] = OrderedDict()
+
+# user id -> (monotonic expiry, profile)
+_profile_cache: OrderedDict[str, tuple[float, Profile]] = OrderedDict()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _unverified_claims(token: str) -> dict[str, Any]:
+    """The token's claims read without verification (remote-validated tokens)."""
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return {}
+
+
+def _is_uuid(value: Any) -> bool:
+    try:
+        UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        cache.pop(key, None)
         return None
+    return entry[1]
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, ttl: float, max_entries: int) -> None:
+    if ttl <= 0:
+        return
+    cache[key] = (time.monotonic() + ttl, value)
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _cache_verified_token(key: bytes, user_id: str, exp: Optional[int]) -> None:
+    """Cache a verified token's user id, never beyond the token's own expiry."""
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    if exp:
+        ttl = min(ttl, exp - time.time())
+    _cache_put(_token_cache, key, user_id, ttl, TOKEN_CACHE_MAX_ENTRIES)
+
+
+async def _authenticate_token(token: str) -> tuple[Optional[str], Optional[int]]:
+    """
+    Verify a bearer token and return its (user id, exp).
+    Local verification first; Supabase Auth only when no local key can decide.
+    """
+    # 1. Verify the signature locally (HS256 secret or cached JWKS)
+    try:
+        claims = await _verify_token_locally(token)
+    except jwt.ExpiredSignatureError:
+        logger.warning("JWT expired (local check)")
+        raise HTTPException(status_code=401, detail="Token expirado")
+    except jwt.PyJWTError as e:
+        logger.warning("JWT rejected (local check)", error=str(e))
+        return None, None
     
-    token = credentials.credentials
+    if claims and claims.get("sub"):
+        # Header and claims were parsed once here; cache hits skip both
+        return claims["sub"], claims.get("exp")
+    
+    # 2. Remote validation, only when no local key can check this token.
+    # The profile fetch for the token's claimed sub overlaps the Auth
+    # round-trip and is kept only if Auth confirms that same user.
+    claims = _unverified_claims(token)
+    claimed_id = claims.get("sub")
+    if not _is_uuid(claimed_id) or _cache_get(_profile_cache, claimed_id) is not None:
+        return await _remote_user_id(token, claims.get("exp")), claims.get("exp")
+    
+    user_id, profile = await asyncio.gather(
+        _remote_user_id(token, claims.get("exp")),
+        _load_profile(claimed_id),
+        return_exceptions=True
+    )
+    if isinstance(user_id, BaseException):
+        raise user_id
+    if user_id == claimed_id and isinstance(profile, Profile):
+        _cache_put(_profile_cache, user_id, profile, PROFILE_CACHE_TTL_SECONDS, PROFILE_CACHE_MAX_ENTRIES)
+    return user_id, claims.get("exp")
+
+
+# blake2b(token) -> in-flight verification; concurrent cache misses share it
+_auth_in_flight: dict[bytes, asyncio.Task] = {}
+
+
+async def _authenticate_token_shared(token: str, key: bytes) -> tuple[Optional[str], Optional[int]]:
+    """_authenticate_token, single-flight per token (one Auth call for a burst)."""
+    loop = asyncio.get_running_loop()
+    task = _auth_in_flight.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(_authenticate_token(token))
+        _auth_in_flight[key] = task
+        task.add_done_callback(
+            lambda done: _auth_in_flight.pop(key, None) if _auth_in_flight.get(key) is done else None
+        )
+    # Shielded so one cancelled request doesn't cancel the others' verification
+    return await asyncio.shield(task)
+
+
+async def _remote_user_id(token: str, exp: Optional[int] = None) -> Optional[str]:
+    """
+    Validate a token with Supabase Auth (GET /auth/v1/user).
+    Revalidations send the last ETag, so an unchanged user costs a bodiless 304.
+    """
     settings = get_settings()
-    user_id = None
+    if _log_level_check.isEnabledFor(logging.DEBUG):
+        logger.debug("Attempting robust remote authentication check")
+    
+    etag_key = _token_key(token)
+    known = _cache_get(_auth_etags, etag_key)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "apikey": settings.supabase_anon_key.get_secret_value()
+    }
+    if known is not None:
+        headers["If-None-Match"] = known[0]
     
     try:
-        # 1. Try local validation for HS256 (Legacy Shared Secret)
-        if settings.supabase_jwt_secret:
-            import jwt
-            import base64
-            secret_value = settings.supabase_jwt_secret.get_secret_value()
-            
-            # Identify algorithm before decoding
-            try:
-                unverified_header = jwt.get_unverified_header(token)
-                alg = unverified_header.get("alg")
-            except Exception:
-                alg = "HS256"
-
-            if alg == "HS256":
-                try:
-                    # Try raw first
-                    payload = jwt.decode(token, secret_value, algorithms=["HS256"], audience="authenticated", options={"verify_exp": True})
-                    user_id = payload.get("sub")
-                except jwt.InvalidSignatureError:
-                    # Try base64
-                    try:
-                        decoded_secret = base64.b64decode(secret_value)
-                        payload = jwt.decode(token, decoded_secret, algorithms=["HS256"], audience="authenticated", options={"verify_exp": True})
-                        user_id = payload.get("sub")
-                    except Exception:
-                        pass
-                except jwt.ExpiredSignatureError:
-                    logger.warning("JWT expired (local check)")
-                    raise HTTPException(status_code=401, detail="Token expirado")
+        resp = await get_auth_http_client().get("/auth/v1/user", headers=headers)
+        
+        if resp.status_code == 304 and known is not None:
+            return known[1]
         
-        # 2. Try Remote Validation (Supports ES256/ECC and any modern Supabase config)
-        if not user_id:
-            import httpx
-            logger.info("Attempting robust remote authentication check")
+        if resp.status_code == 200:
+            user_data = orjson.loads(resp.content)
+            user_id = user_data.get("id")
+            if _log_level_check.isEnabledFor(logging.DEBUG):
+                logger.debug("Remote authentication successful", user_id=user_id)
             
-            async with httpx.AsyncClient(timeout=10.0) as http_client:
-                try:
-                    resp = await http_client.get(
-                        f"{settings.supabase_url}/auth/v1/user",
-                        headers={
-                            "Authorization": f"Bearer {token}",
-                            "apikey": settings.supabase_anon_key.get_secret_value()
-                        }
-                    )
-                    
-                    if resp.status_code == 200:
-                        user_data = resp.json()
-                        user_id = user_data.get("id")
-                        logger.info("Remote authentication successful", user_id=user_id)
-                    else:
-                        logger.warning(
-                            "Remote authentication failed", 
-                            status=resp.status_code, 
-                            response=resp.text[:100]
-                        )
-                except Exception as e:
-                    logger.error("Remote authentication error", error=str(e))
-                    user_id = None
+            etag = resp.headers.get("ETag")
+            if etag and user_id:
+                ttl = exp - time.time() if exp else TOKEN_CACHE_TTL_SECONDS
+                _cache_put(_auth_etags, etag_key, (etag, user_id), ttl, TOKEN_CACHE_MAX_ENTRIES)
+            return user_id
         
-        if not user_id:
-            logger.warning("Authentication failed: User could not be verified locally or remotely")
-            return None
+        logger.warning(
+            "Remote authentication failed", 
+            status=resp.status_code, 
+            response=resp.text[:100]
+        )
+    except Exception as e:
+        logger.error("Remote authentication error", error=str(e))
+    
+    return None
+
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Verified users without a profiles row get a copy of this (validated once;
+# timestamps are the process start, not per request)
+_FALLBACK_PROFILE = Profile(
+    id=UUID(int=0),
+    email="verified@auth.supabase",
+    full_name="Usuario Autenticado",
+    created_at=datetime.now(timezone.utc),
+    updated_at=datetime.now(timezone.utc)
+)
+
+
+class ProfileLoader:
+    """
+    Coalesces concurrent profile lookups into one PostgREST query.
+    
+    Ids requested within max_wait seconds (or until max_batch distinct ids
+    are pending) are fetched with a single in_("id", ...) select, and every
+    waiter gets its row (None if the profile doesn't exist).
+    """
+    
+    def __init__(self, max_batch: int = 25, max_wait: float = 0.005):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._fetches: set[asyncio.Task] = set()
+    
+    async def load(self, user_id: str) -> Optional[dict[str, Any]]:
+        """Get the profiles row for a user id."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
         
-        # 3. Get profile (always use admin client for consistent lookup)
-        from app.db.supabase import get_supabase_admin_client
-        admin_client = get_supabase_admin_client()
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
         
-        profile_result = admin_client.table("profiles").select("*").eq(
-            "id", user_id
-        ).single().execute()
+        return await future
+    
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._fetch(batch))
+            self._fetches.add(task)
+            task.add_done_callback(self._fetches.discard)
+    
+    async def _fetch(self, batch: dict[str, list[asyncio.Future]]) -> None:
+        admin_db = get_async_supabase_admin_client()
         
-        if profile_result.data:
-            return Profile(**profile_result.data)
+        try:
+            result = await admin_db.execute(
+                admin_db.table("profiles").select(PROFILE_COLUMNS).in_("id", list(batch))
+            )
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
         
-        # Fallback profile if record doesn't exist yet
-        return Profile(
-            id=UUID(user_id),
-            email="verified@auth.supabase", 
-            full_name="Usuario Autenticado",
-            role="user",
-            access_level=AccessLevel.EXTERNO,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
+        rows = {str(row["id"]): row for row in result.data or []}
+        if _log_level_check.isEnabledFor(logging.DEBUG):
+            logger.debug("Profile batch loaded", requested=len(batch), found=len(rows))
+        for user_id, futures in batch.items():
+            row = rows.get(user_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(row)
+
+
+_profile_loader: Optional[ProfileLoader] = None
+
+
+def get_profile_loader() -> ProfileLoader:
+    """Get or create the process-wide profile loader."""
+    global _profile_loader
+    if _profile_loader is None:
+        _profile_loader = ProfileLoader()
+    return _profile_loader
+
+
+async def _load_profile(user_id: str) -> Profile:
+    """Fetch the profile row (always via the admin client for consistent lookup)."""
+    row = await get_profile_loader().load(user_id)
+    if row:
+        # Rows come from the profiles table through PROFILE_COLUMNS, so only
+        # the non-JSON types need coercing; skip full validation
+        return Profile.model_construct(**{
+            **row,
+            "id": UUID(row["id"]),
+            "created_at": _DATETIME_ADAPTER.validate_python(row["created_at"]),
+            "updated_at": _DATETIME_ADAPTER.validate_python(row["updated_at"])
+        })
+    
+    # Fallback profile if record doesn't exist yet
+    return _FALLBACK_PROFILE.model_copy(update={"id": UUID(user_id)})
+
+
+async def get_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+) -> Optional[Profile]:
+    """
+    Get current authenticated user from Supabase JWT.
+    Supports both legacy HS256 (Shared Secret) and modern ES256 (ECC) tokens.
+    
+    Verified tokens and profiles are cached separately, so a token seen
+    within its lifetime skips verification and, within the profile TTL,
+    the profile lookup too.
+    """
+    if not credentials:
+        return None
+    
+    token = credentials.credentials
+    token_key = _token_key(token)
+    
+    try:
+        user_id = _cache_get(_token_cache, token_key)
+        if user_id is None:
+            user_id, exp = await _authenticate_token_shared(token, token_key)
+            if not user_id:
+                logger.warning("Authentication failed: User could not be verified locally or remotely")
+                return None
+            _cache_verified_token(token_key, user_id, exp)
         
+        profile = _cache_get(_profile_cache, user_id)
+        if profile is None:
+            profile = await _load_profile(user_id)
+            _cache_put(_profile_cache, user_id, profile, PROFILE_CACHE_TTL_SECONDS, PROFILE_CACHE_MAX_ENTRIES)
+        return profile
+    
     except HTTPException:
         raise
     except Exception as e:
         logger.error("Unexpected authentication error in zero_trust", error=str(e))
         return None
-        
+
+
 async def build_security_context(
     request: Request,
     user: Optional[Profile] = None
@@ -191,22 +603,25 @@ async def build_security_context(
     Args:
         request: FastAPI request
         user: Authenticated user profile
-        
+    
     Returns:
         Security context for the request
     """
-    validator = ZeroTrustValidator()
+    headers = request.headers
+    client = request.client
     
     # Get or generate session ID
-    session_id = request.headers.get("X-Session-ID") or request.cookies.get("session_id") or str(UUID(int=0))
+    session_id = headers.get("X-Session-ID") or request.cookies.get("session_id") or _NIL_ID
     
-    return SecurityContext(
-        user_id=str(user.id) if user else str(UUID(int=0)),
-        access_level=validator.determine_access_level(request).value,
-        device_verified=validator.verify_device(request),
+    # Every field is built here from typed values; skip re-validation
+    return SecurityContext.model_construct(
+        user_id=str(user.id) if user else _NIL_ID,
+        is_anonymous=user is None,
+        access_level=ZeroTrustValidator.determine_access_level(request).value,
+        device_verified=ZeroTrustValidator.verify_device(request),
         session_id=session_id,
-        ip_address=request.client.host if request.client else None,
-        user_agent=request.headers.get("User-Agent")
+        ip_address=client.host if client else None,
+        user_agent=headers.get("User-Agent")
     )
 
 
@@ -217,17 +632,12 @@ def require_access_level(minimum_level: AccessLevel):
     Usage:
         @app.get("/admin", dependencies=[Depends(require_access_level(AccessLevel.SEDE_PRINCIPAL))])
     """
+    min_rank = _LEVEL_RANK[minimum_level]
+    
     async def check_access(request: Request):
-        validator = ZeroTrustValidator()
-        current_level = validator.determine_access_level(request)
-        
-        level_order = {
-            AccessLevel.EXTERNO: 0,
-            AccessLevel.VPN_INSTITUCIONAL: 1,
-            AccessLevel.SEDE_PRINCIPAL: 2
-        }
+        current_level = ZeroTrustValidator.determine_access_level(request)
         
-        if level_order[current_level] < level_order[minimum_level]:
+        if _LEVEL_RANK[current_level] < min_rank:
             logger.warning(
                 "Access denied - insufficient level",
                 required=minimum_level.value,
@@ -0,0 +1,30 @@
+"""
+Tool Base - Shared BaseTool for the institutional tools
+"""
+
+from typing import Any, Optional
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+
+class SchemaTool(BaseTool):
+    """
+    BaseTool whose args_schema is a plain pydantic model.
+    
+    Dict inputs are validated with the schema's compiled validator and
+    passed on as field -> value, skipping BaseTool's per-call annotation
+    walk (which looks for injected args these schemas never declare).
+    Every field is either required or has a default, so the result matches
+    what BaseTool would build. Other inputs take the stock path.
+    """
+    
+    def _parse_input(
+        self,
+        tool_input: str | dict[str, Any],
+        tool_call_id: Optional[str]
+    ) -> str | dict[str, Any]:
+        schema = self.args_schema
+        if isinstance(tool_input, dict) and isinstance(schema, type) and issubclass(schema, BaseModel):
+            return dict(schema.model_validate(tool_input))
+        return super()._parse_input(tool_input, tool_call_id)
@@ -4,11 +4,47 @@ Cartera Tools - Mock implementations for financial portfolio management
 
 from typing import Any, Optional
 from datetime import datetime
-import random
 
-from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from app.tools.mock_data import draw_ints, int_bounds
+from app.tools.base import SchemaTool
+
+_ESTADOS_CARTERA = ("Al día", "En mora", "Acuerdo de pago")
+
+_CARTERA_INDIVIDUAL = int_bounds(
+    (0, 5000000),  # total_deuda
+    (0, 2000000),  # vencida
+    (0, 3000000),  # al_dia
+    (0, len(_ESTADOS_CARTERA) - 1),  # estado
+)
+
+_CARTERA_CONSOLIDADA = int_bounds(
+    (800000000, 1200000000),  # total
+    (500000000, 700000000),  # corriente
+    (50000000, 100000000),  # vencida_30
+    (30000000, 80000000),  # vencida_60
+    (100000000, 200000000),  # vencida_90_mas
+    (80000000, 120000000),  # provision
+    (8, 15),  # tasa_morosidad
+    (25, 45),  # dias_promedio_mora
+    (50000000, 150000000),  # recuperacion_mes
+)
+
+_MOROSIDAD = int_bounds(
+    (200, 400),  # estudiantes_morosos
+    (8, 15),  # porcentaje_poblacion
+    (150000000, 300000000),  # monto_en_mora
+    (60, 120),  # edad_promedio_deuda
+    (100, 150), (30000000, 50000000),  # 30_dias
+    (50, 80), (40000000, 70000000),  # 60_dias
+    (30, 60), (50000000, 100000000),  # 90_dias
+    (20, 50), (80000000, 150000000),  # mas_90
+    (0, 1),  # tendencia
+)
+
+_NUMERO_FACTURA = int_bounds((1000, 9999))
+
 
 class ConsultarCarteraInput(BaseModel):
     """Input for portfolio lookup."""
@@ -16,7 +52,7 @@ class ConsultarCarteraInput(BaseModel):
     programa: Optional[str] = Field(default=None, description="Programa académico")
 
 
-class ConsultarCarteraTool(BaseTool):
+class ConsultarCarteraTool(SchemaTool):
     """Consulta estado de cartera estudiantil."""
     
     name: str = "consultar_cartera"
@@ -27,36 +63,41 @@ class ConsultarCarteraTool(BaseTool):
         """Simulated portfolio lookup."""
         if documento:
             # Individual student
+            total_deuda, vencida, al_dia, estado = draw_ints(_CARTERA_INDIVIDUAL)
             return {
                 "tipo": "individual",
                 "documento": documento,
                 "nombre": "Juan Carlos Pérez López",
                 "cartera": {
-                    "total_deuda": random.randint(0, 5000000),
-                    "vencida": random.randint(0, 2000000),
-                    "al_dia": random.randint(0, 3000000),
+                    "total_deuda": total_deuda,
+                    "vencida": vencida,
+                    "al_dia": al_dia,
                     "ultimo_pago": "2025-01-15",
                     "monto_ultimo_pago": 1500000,
-                    "estado": random.choice(["Al día", "En mora", "Acuerdo de pago"])
+                    "estado": _ESTADOS_CARTERA[estado]
                 }
             }
         else:
             # Program or global
+            (
+                total, corriente, vencida_30, vencida_60, vencida_90_mas, provision,
+                tasa_morosidad, dias_promedio_mora, recuperacion_mes
+            ) = draw_ints(_CARTERA_CONSOLIDADA)
             return {
                 "tipo": "consolidado",
                 "programa": programa or "Todos",
                 "cartera": {
-                    "total": random.randint(800000000, 1200000000),
-                    "corriente": random.randint(500000000, 700000000),
-                    "vencida_30": random.randint(50000000, 100000000),
-                    "vencida_60": random.randint(30000000, 80000000),
-                    "vencida_90_mas": random.randint(100000000, 200000000),
-                    "provision": random.randint(80000000, 120000000)
+                    "total": total,
+                    "corriente": corriente,
+                    "vencida_30": vencida_30,
+                    "vencida_60": vencida_60,
+                    "vencida_90_mas": vencida_90_mas,
+                    "provision": provision
                 },
                 "indicadores": {
-                    "tasa_morosidad": f"{random.randint(8, 15)}%",
-                    "dias_promedio_mora": random.randint(25, 45),
-                    "recuperacion_mes": random.randint(50000000, 150000000)
+                    "tasa_morosidad": f"{tasa_morosidad}%",
+                    "dias_promedio_mora": dias_promedio_mora,
+                    "recuperacion_mes": recuperacion_mes
                 }
             }
     
@@ -70,7 +111,7 @@ class AnalizarMorosidadInput(BaseModel):
     segmento: Optional[str] = Field(default=None, description="Segmento específico")
 
 
-class AnalizarMorosidadTool(BaseTool):
+class AnalizarMorosidadTool(SchemaTool):
     """Analiza patrones de morosidad."""
     
     name: str = "analizar_morosidad"
@@ -79,22 +120,27 @@ class AnalizarMorosidadTool(BaseTool):
     
     def _run(self, periodo: str, segmento: Optional[str] = None) -> dict[str, Any]:
         """Simulated delinquency analysis."""
+        (
+            morosos, porcentaje, monto, edad_deuda,
+            cant_30, monto_30, cant_60, monto_60, cant_90, monto_90, cant_mas_90, monto_mas_90,
+            mejorando
+        ) = draw_ints(_MOROSIDAD)
         return {
             "periodo": periodo,
             "segmento": segmento or "General",
             "analisis": {
-                "estudiantes_morosos": random.randint(200, 400),
-                "porcentaje_poblacion": f"{random.randint(8, 15)}%",
-                "monto_en_mora": random.randint(150000000, 300000000),
-                "edad_promedio_deuda": f"{random.randint(60, 120)} días"
+                "estudiantes_morosos": morosos,
+                "porcentaje_poblacion": f"{porcentaje}%",
+                "monto_en_mora": monto,
+                "edad_promedio_deuda": f"{edad_deuda} días"
             },
             "segmentacion_mora": {
-                "30_dias": {"cantidad": random.randint(100, 150), "monto": random.randint(30000000, 50000000)},
-                "60_dias": {"cantidad": random.randint(50, 80), "monto": random.randint(40000000, 70000000)},
-                "90_dias": {"cantidad": random.randint(30, 60), "monto": random.randint(50000000, 100000000)},
-                "mas_90": {"cantidad": random.randint(20, 50), "monto": random.randint(80000000, 150000000)}
+                "30_dias": {"cantidad": cant_30, "monto": monto_30},
+                "60_dias": {"cantidad": cant_60, "monto": monto_60},
+                "90_dias": {"cantidad": cant_90, "monto": monto_90},
+                "mas_90": {"cantidad": cant_mas_90, "monto": monto_mas_90}
             },
-            "tendencia": "Mejorando" if random.random() > 0.5 else "Deteriorando",
+            "tendencia": "Mejorando" if mejorando else "Deteriorando",
             "recomendaciones": [
                 "Fortalecer cobranza preventiva",
                 "Implementar alertas tempranas",
@@ -113,7 +159,7 @@ class GenerarFacturaInput(BaseModel):
     valor: int = Field(description="Valor a facturar")
 
 
-class GenerarFacturaTool(BaseTool):
+class GenerarFacturaTool(SchemaTool):
     """Genera factura para un estudiante."""
     
     name: str = "generar_factura"
@@ -122,11 +168,12 @@ class GenerarFacturaTool(BaseTool):
     
     def _run(self, documento: str, concepto: str, valor: int) -> dict[str, Any]:
         """Simulated invoice generation."""
+        (numero,) = draw_ints(_NUMERO_FACTURA)
         return {
             "status": "pendiente_aprobacion",
             "mensaje": "Esta operación requiere aprobación humana",
             "factura_borrador": {
-                "numero": f"FAC-{datetime.now().strftime('%Y%m%d')}-{random.randint(1000, 9999)}",
+                "numero": f"FAC-{datetime.now().strftime('%Y%m%d')}-{numero}",
                 "fecha": datetime.now().isoformat(),
                 "documento_estudiante": documento,
                 "concepto": concepto,
@@ -6,14 +6,19 @@ from typing import Any, Optional
 from uuid import UUID
 
 import structlog
-from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from app.db.supabase import get_supabase_admin_client
+from app.db.supabase import get_async_supabase_admin_client, get_supabase_admin_client
+from app.db.models import vector_literal
+from app.core.llm import generate_embedding
 from app.config import get_settings
+from app.tools.base import SchemaTool
 
 logger = structlog.get_logger(__name__)
 
+# Minimum cosine similarity for a memory to be returned
+MATCH_THRESHOLD = 0.5
+
 
 class MemorySearchInput(BaseModel):
     """Input for memory search."""
@@ -22,7 +27,39 @@ class MemorySearchInput(BaseModel):
     agent_id: Optional[str] = Field(default=None, description="Filtrar por agente específico")
 
 
-class MemorySearchTool(BaseTool):
+def _text_search_query(client: Any, query: str, limit: int, agent_id: Optional[str]) -> Any:
+    """Substring scan over memory content (no embedding needed)."""
+    search_query = client.table("memories").select(
+        "id, content, memory_type, importance, created_at"
+    ).ilike("content", f"%{query}%").limit(limit)
+    
+    if agent_id:
+        search_query = search_query.eq("agent_id", agent_id)
+    return search_query
+
+
+def _search_result(query: str, result: Any, metodo: str) -> dict[str, Any]:
+    memories = result.data if result.data else []
+    return {
+        "query": query,
+        "results": memories,
+        "total_encontrados": len(memories),
+        "metodo": metodo
+    }
+
+
+def _search_error(query: str, e: Exception) -> dict[str, Any]:
+    logger.error("Memory search failed", error=str(e))
+    # Return empty results on error (table might not exist yet)
+    return {
+        "query": query,
+        "results": [],
+        "total_encontrados": 0,
+        "error": str(e)
+    }
+
+
+class MemorySearchTool(SchemaTool):
     """Busca en la memoria de largo plazo."""
     
     name: str = "buscar_memoria"
@@ -30,37 +67,41 @@ class MemorySearchTool(BaseTool):
     args_schema: type[BaseModel] = MemorySearchInput
     
     def _run(self, query: str, limit: int = 5, agent_id: Optional[str] = None) -> dict[str, Any]:
-        """Search memories using similarity."""
+        """
+        Search memories from synchronous callers.
+        Embeddings come from the async client, so this path uses the text search;
+        agents go through _arun and get the vector search.
+        """
         try:
-            client = get_supabase_admin_client()
-            
-            # For now, do a simple text search until embeddings are implemented
-            search_query = client.table("memories").select(
-                "id, content, memory_type, importance, created_at"
-            ).ilike("content", f"%{query}%").limit(limit)
+            result = _text_search_query(get_supabase_admin_client(), query, limit, agent_id).execute()
+            return _search_result(query, result, "text_search")
+        except Exception as e:
+            return _search_error(query, e)
+    
+    async def _arun(self, query: str, limit: int = 5, agent_id: Optional[str] = None) -> dict[str, Any]:
+        try:
+            db = get_async_supabase_admin_client()
+            query_embedding = await generate_embedding(query)
             
-            if agent_id:
-                search_query = search_query.eq("agent_id", agent_id)
+            result = None
+            if any(query_embedding):
+                # Ranked cosine search in one round-trip (see match_memories)
+                result = await db.execute(db.rpc("match_memories", {
+                    "query_embedding": vector_literal(query_embedding),
+                    "match_threshold": MATCH_THRESHOLD,
+                    "match_count": limit,
+                    "filter_agent_id": agent_id
+                }))
+                metodo = "vector_similarity"
             
-            result = search_query.execute()
-            memories = result.data if result.data else []
+            if not (result and result.data):
+                # Substring scan when the provider call failed (zero vector) or
+                # nothing matched: rows stored before embeddings were written
+                # have a NULL embedding and never pass the cosine threshold
+                result = await db.execute(_text_search_query(db, query, limit, agent_id))
+                metodo = "text_search"
             
-            return {
-                "query": query,
-                "results": memories,
-                "total_encontrados": len(memories),
-                "metodo": "text_search"  # Will be "vector_similarity" after embedding implementation
-            }
+            return _search_result(query, result, metodo)
             
         except Exception as e:
-            logger.error("Memory search failed", error=str(e))
-            # Return empty results on error (table might not exist yet)
-            return {
-                "query": query,
-                "results": [],
-                "total_encontrados": 0,
-                "error": str(e)
-            }
-    
-    async def _arun(self, query: str, limit: int = 5, agent_id: Optional[str] = None) -> dict[str, Any]:
-        return self._run(query, limit, agent_id)
+            return _search_error(query, e)
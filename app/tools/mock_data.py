@@ -0,0 +1,18 @@
+"""
+Mock Data - Random values for the simulated institutional tools
+Each tool response draws all of its numbers in one vectorized call.
+"""
+
+import numpy as np
+
+_rng = np.random.default_rng()
+
+
+def int_bounds(*pairs: tuple[int, int]) -> np.ndarray:
+    """Pack inclusive (low, high) pairs into a bounds array (build once at import)."""
+    return np.array(pairs, dtype=np.int64)
+
+
+def draw_ints(bounds: np.ndarray) -> list[int]:
+    """Draw one integer per (low, high) row, inclusive, as plain Python ints."""
+    return _rng.integers(bounds[:, 0], bounds[:, 1], endpoint=True).tolist()
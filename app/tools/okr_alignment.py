@@ -2,24 +2,65 @@
 OKR Alignment Tool - Links actions to institutional objectives
 """
 
+from functools import lru_cache
 from typing import Any, Optional
 from uuid import UUID
 
 import structlog
-from langchain_core.tools import BaseTool
+from postgrest.exceptions import APIError
 from pydantic import BaseModel, Field
 
 from app.db.supabase import get_supabase_admin_client
+from app.tools.base import SchemaTool
 
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _text_tokens(text: str) -> frozenset[str]:
+    """Lowercase token set, memoized per distinct title + description (LRU-bounded)."""
+    return frozenset(text.lower().split())
+
+
+def _tokens_for(objective: dict[str, Any]) -> frozenset[str]:
+    """Token set of an objective; edits change the text and miss the cache."""
+    return _text_tokens(f"{objective['title']} {objective.get('description') or ''}")
+
+
+def _match_okrs_locally(client: Any, accion: str, k: int) -> tuple[list[dict[str, Any]], int]:
+    """
+    Keyword scoring in Python, for databases without match_okrs installed.
+    Returns the top k scored objectives and the total number of matches.
+    """
+    result = client.table("objectives").select(
+        "id, title, description, progress"
+    ).eq("is_active", True).execute()
+    
+    keywords = frozenset(accion.lower().split())
+    if not keywords:
+        return [], 0
+    
+    scored = []
+    for obj in result.data or []:
+        score = len(keywords & _tokens_for(obj))
+        if score:
+            scored.append({
+                "id": obj["id"],
+                "title": obj["title"],
+                "relevance_score": score / len(keywords),
+                "progress": obj["progress"]
+            })
+    
+    scored.sort(key=lambda x: x["relevance_score"], reverse=True)
+    return scored[:k], len(scored)
+
+
 class OKRAlignmentInput(BaseModel):
     """Input for OKR alignment check."""
     accion: str = Field(description="Descripción de la acción a vincular")
 
 
-class OKRAlignmentTool(BaseTool):
+class OKRAlignmentTool(SchemaTool):
     """Alinea acciones con OKRs institucionales."""
     
     name: str = "alinear_okr"
@@ -31,39 +72,30 @@ class OKRAlignmentTool(BaseTool):
         try:
             client = get_supabase_admin_client()
             
-            # Get active objectives
-            result = client.table("objectives").select(
-                "id, title, description, period, progress"
-            ).eq("is_active", True).execute()
-            
-            objectives = result.data if result.data else []
-            
-            # Simple keyword matching (in production, use embeddings)
-            keywords = accion.lower().split()
-            scored_objectives = []
-            
-            for obj in objectives:
-                score = 0
-                text = f"{obj['title']} {obj.get('description', '')}".lower()
-                for keyword in keywords:
-                    if keyword in text:
-                        score += 1
-                if score > 0:
-                    scored_objectives.append({
-                        "id": obj["id"],
-                        "title": obj["title"],
-                        "relevance_score": score / len(keywords),
-                        "progress": obj["progress"]
-                    })
-            
-            # Sort by relevance
-            scored_objectives.sort(key=lambda x: x["relevance_score"], reverse=True)
+            # Ranked full-text match over active objectives (see match_okrs)
+            try:
+                result = client.rpc("match_okrs", {"query": accion, "k": 3}).execute()
+            except APIError as e:
+                logger.warning("match_okrs unavailable, scoring in Python", error=str(e))
+                okrs, total = _match_okrs_locally(client, accion, 3)
+            else:
+                rows = result.data or []
+                okrs = [
+                    {
+                        "id": row["id"],
+                        "title": row["title"],
+                        "relevance_score": row["relevance"],
+                        "progress": row["progress"]
+                    }
+                    for row in rows
+                ]
+                total = rows[0]["total_matches"] if rows else 0
             
             return {
                 "accion": accion,
-                "okrs_relevantes": scored_objectives[:3],
-                "total_encontrados": len(scored_objectives),
-                "recomendacion": scored_objectives[0]["title"] if scored_objectives else None
+                "okrs_relevantes": okrs,
+                "total_encontrados": total,
+                "recomendacion": okrs[0]["title"] if okrs else None
             }
             
         except Exception as e:
@@ -5,18 +5,35 @@ These are placeholder tools that simulate SIGEAM API responses.
 
 from typing import Any, Optional
 from datetime import datetime
-import random
 
-from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from app.tools.mock_data import draw_ints, int_bounds
+from app.tools.base import SchemaTool
+
+_ESTADISTICAS_MATRICULA = int_bounds(
+    (2500, 3500),  # total_matriculados
+    (400, 600),  # nuevos
+    (50, 100),  # reintegros
+    (10, 30),  # transferencias
+    (3, 8),  # crecimiento_vs_anterior
+    (1500, 2000),  # diurna
+    (800, 1200),  # nocturna
+    (200, 400),  # virtual
+)
+
+_REPORTE_COHORTE = int_bounds(
+    (300, 500),  # ingresaron
+    (75, 85),  # tasa_retencion
+)
+
 
 class ConsultarEstudianteInput(BaseModel):
     """Input for student lookup."""
     documento: str = Field(description="Número de documento del estudiante")
 
 
-class ConsultarEstudianteTool(BaseTool):
+class ConsultarEstudianteTool(SchemaTool):
     """Consulta información de un estudiante en SIGEAM."""
     
     name: str = "consultar_estudiante"
@@ -50,7 +67,7 @@ class EstadisticasMatriculaInput(BaseModel):
     programa: Optional[str] = Field(default=None, description="Programa académico (opcional)")
 
 
-class ObtenerEstadisticasMatriculaTool(BaseTool):
+class ObtenerEstadisticasMatriculaTool(SchemaTool):
     """Obtiene estadísticas de matrícula."""
     
     name: str = "obtener_estadisticas_matricula"
@@ -59,20 +76,24 @@ class ObtenerEstadisticasMatriculaTool(BaseTool):
     
     def _run(self, periodo: str, programa: Optional[str] = None) -> dict[str, Any]:
         """Simulated enrollment statistics."""
+        (
+            total, nuevos, reintegros, transferencias, crecimiento,
+            diurna, nocturna, virtual
+        ) = draw_ints(_ESTADISTICAS_MATRICULA)
         return {
             "periodo": periodo,
             "programa": programa or "Todos",
             "estadisticas": {
-                "total_matriculados": random.randint(2500, 3500),
-                "nuevos": random.randint(400, 600),
-                "reintegros": random.randint(50, 100),
-                "transferencias": random.randint(10, 30),
-                "crecimiento_vs_anterior": f"+{random.randint(3, 8)}%"
+                "total_matriculados": total,
+                "nuevos": nuevos,
+                "reintegros": reintegros,
+                "transferencias": transferencias,
+                "crecimiento_vs_anterior": f"+{crecimiento}%"
             },
             "por_jornada": {
-                "diurna": random.randint(1500, 2000),
-                "nocturna": random.randint(800, 1200),
-                "virtual": random.randint(200, 400)
+                "diurna": diurna,
+                "nocturna": nocturna,
+                "virtual": virtual
             }
         }
     
@@ -86,7 +107,7 @@ class ReporteCohorteInput(BaseModel):
     programa: Optional[str] = Field(default=None, description="Programa académico (opcional)")
 
 
-class GenerarReporteCohorteToolmocktool(BaseTool):
+class GenerarReporteCohorteToolmocktool(SchemaTool):
     """Genera reporte de cohorte estudiantil."""
     
     name: str = "generar_reporte_cohorte"
@@ -95,7 +116,7 @@ class GenerarReporteCohorteToolmocktool(BaseTool):
     
     def _run(self, cohorte: str, programa: Optional[str] = None) -> dict[str, Any]:
         """Simulated cohort report."""
-        total = random.randint(300, 500)
+        total, tasa_retencion = draw_ints(_REPORTE_COHORTE)
         return {
             "cohorte": cohorte,
             "programa": programa or "Todos los programas",
@@ -105,7 +126,7 @@ class GenerarReporteCohorteToolmocktool(BaseTool):
                 "activos": int(total * 0.65),
                 "graduados": int(total * 0.15),
                 "desertores": int(total * 0.20),
-                "tasa_retencion": f"{random.randint(75, 85)}%",
+                "tasa_retencion": f"{tasa_retencion}%",
                 "promedio_semestres_graduacion": 10.5
             },
             "distribucion_por_estado": {
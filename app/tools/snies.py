@@ -5,11 +5,43 @@ Sistema Nacional de Información de Educación Superior
 
 from typing import Any, Optional
 from datetime import datetime
-import random
 
-from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from app.tools.mock_data import draw_ints, int_bounds
+from app.tools.base import SchemaTool
+
+_PROGRAMAS_GRADUADOS = (
+    ("Ingeniería de Sistemas", (40, 60)),
+    ("Administración de Empresas", (50, 80)),
+    ("Contaduría Pública", (40, 70)),
+    ("Ingeniería Industrial", (35, 55)),
+    ("Trabajo Social", (30, 50)),
+)
+
+_REPORTE_MATRICULA = int_bounds(
+    (2800, 3500),  # total_matriculados
+    (2500, 3000), (150, 250), (50, 100),  # por_nivel
+    (1400, 1800), (1400, 1700),  # por_sexo
+    (300, 500), (800, 1200), (700, 1000), (200, 400), (50, 100), (10, 30),  # por_estrato 1-6
+    (400, 600),  # nuevos_primer_semestre
+)
+
+_REPORTE_GRADUADOS = int_bounds(
+    (350, 500),  # total_graduados
+    *(bounds for _, bounds in _PROGRAMAS_GRADUADOS),  # por_programa
+    (75, 90),  # tasa_empleabilidad
+)
+
+_REPORTE_DOCENTES = int_bounds(
+    (180, 250),  # total_docentes
+    (60, 90), (30, 50), (80, 120),  # por_dedicacion
+    (15, 30), (80, 120), (40, 60), (20, 40),  # por_formacion
+    (15, 25),  # relacion_estudiante_docente
+)
+
+_REPORTE_GENERICO = int_bounds((1000, 5000))
+
 
 class ReporteSNIESInput(BaseModel):
     """Input for SNIES report generation."""
@@ -17,7 +49,7 @@ class ReporteSNIESInput(BaseModel):
     periodo: str = Field(description="Periodo del reporte")
 
 
-class GenerarReporteSNIESTool(BaseTool):
+class GenerarReporteSNIESTool(SchemaTool):
     """Genera reportes para SNIES."""
     
     name: str = "generar_reporte_snies"
@@ -40,61 +72,40 @@ class GenerarReporteSNIESTool(BaseTool):
             "estado": "generado"
         }
         
-        if tipo_reporte.lower() == "matricula":
+        tipo = tipo_reporte.lower()
+        if tipo == "matricula":
+            values = draw_ints(_REPORTE_MATRICULA)
             base_report["datos"] = {
-                "total_matriculados": random.randint(2800, 3500),
-                "por_nivel": {
-                    "pregrado": random.randint(2500, 3000),
-                    "especializacion": random.randint(150, 250),
-                    "maestria": random.randint(50, 100)
-                },
-                "por_sexo": {
-                    "masculino": random.randint(1400, 1800),
-                    "femenino": random.randint(1400, 1700)
-                },
-                "por_estrato": {
-                    "1": random.randint(300, 500),
-                    "2": random.randint(800, 1200),
-                    "3": random.randint(700, 1000),
-                    "4": random.randint(200, 400),
-                    "5": random.randint(50, 100),
-                    "6": random.randint(10, 30)
-                },
-                "nuevos_primer_semestre": random.randint(400, 600)
+                "total_matriculados": values[0],
+                "por_nivel": dict(zip(("pregrado", "especializacion", "maestria"), values[1:4])),
+                "por_sexo": dict(zip(("masculino", "femenino"), values[4:6])),
+                "por_estrato": dict(zip(("1", "2", "3", "4", "5", "6"), values[6:12])),
+                "nuevos_primer_semestre": values[12]
             }
-        elif tipo_reporte.lower() == "graduados":
+        elif tipo == "graduados":
+            total, *por_programa, empleabilidad = draw_ints(_REPORTE_GRADUADOS)
             base_report["datos"] = {
-                "total_graduados": random.randint(350, 500),
+                "total_graduados": total,
                 "por_programa": [
-                    {"programa": "Ingeniería de Sistemas", "graduados": random.randint(40, 60)},
-                    {"programa": "Administración de Empresas", "graduados": random.randint(50, 80)},
-                    {"programa": "Contaduría Pública", "graduados": random.randint(40, 70)},
-                    {"programa": "Ingeniería Industrial", "graduados": random.randint(35, 55)},
-                    {"programa": "Trabajo Social", "graduados": random.randint(30, 50)}
+                    {"programa": programa, "graduados": graduados}
+                    for (programa, _), graduados in zip(_PROGRAMAS_GRADUADOS, por_programa)
                 ],
                 "tiempo_promedio_graduacion": "5.2 años",
-                "tasa_empleabilidad": f"{random.randint(75, 90)}%"
+                "tasa_empleabilidad": f"{empleabilidad}%"
             }
-        elif tipo_reporte.lower() == "docentes":
+        elif tipo == "docentes":
+            values = draw_ints(_REPORTE_DOCENTES)
             base_report["datos"] = {
-                "total_docentes": random.randint(180, 250),
-                "por_dedicacion": {
-                    "tiempo_completo": random.randint(60, 90),
-                    "medio_tiempo": random.randint(30, 50),
-                    "catedra": random.randint(80, 120)
-                },
-                "por_formacion": {
-                    "doctorado": random.randint(15, 30),
-                    "maestria": random.randint(80, 120),
-                    "especializacion": random.randint(40, 60),
-                    "pregrado": random.randint(20, 40)
-                },
-                "relacion_estudiante_docente": f"{random.randint(15, 25)}:1"
+                "total_docentes": values[0],
+                "por_dedicacion": dict(zip(("tiempo_completo", "medio_tiempo", "catedra"), values[1:4])),
+                "por_formacion": dict(zip(("doctorado", "maestria", "especializacion", "pregrado"), values[4:8])),
+                "relacion_estudiante_docente": f"{values[8]}:1"
             }
         else:
+            (registros,) = draw_ints(_REPORTE_GENERICO)
             base_report["datos"] = {
                 "mensaje": "Tipo de reporte no especificado, datos genéricos generados",
-                "registros_procesados": random.randint(1000, 5000)
+                "registros_procesados": registros
             }
         
         return base_report
@@ -1,44 +1,85 @@
 
-import os
 import asyncio
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import random
 
-load_dotenv()
+import httpx
+from postgrest.exceptions import APIError
 
-async def check_pdi_tables():
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+from _clients import get_supabase
+
+TABLES = ["pdi_documents", "pdi_entities", "pdi_entity_relations"]
+
+# Gateway statuses Supabase returns while a project is waking up
+_TRANSIENT_STATUS = {"502", "503", "504", "520"}
+
+def _is_transient(error):
+    if isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, APIError) and str(error.code) in _TRANSIENT_STATUS
+
+async def _with_retry(fn, attempts=3):
+    """Run a blocking probe in a thread, retrying transient failures with jittered backoff."""
+    for i in range(attempts):
+        try:
+            return await asyncio.to_thread(fn)
+        except Exception as e:
+            if i == attempts - 1 or not _is_transient(e):
+                raise
+            await asyncio.sleep((2 ** i) * 0.1 + random.random() * 0.05)
+
+async def probe_pdi_schema(supabase, tables=TABLES):
+    """Run both probes concurrently; returns (tables_result, rpc_result), exceptions included."""
+    def probe_tables():
+        # Single catalog lookup for every table (see migrations/004_check_tables.sql)
+        return supabase.rpc("check_tables", {"names": tables}).execute()
     
-    if not url or not key:
-        print("Error: SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY not found in .env")
-        return
+    def probe_rpc():
+        # Metadata-only lookup (see migrations/005_rpc_exists.sql)
+        return supabase.rpc("rpc_exists", {"n": "match_pdi_entities"}).execute()
+    
+    # supabase-py is sync: run every probe in a thread so the round trips overlap
+    return await asyncio.gather(
+        _with_retry(probe_tables),
+        _with_retry(probe_rpc),
+        return_exceptions=True
+    )
 
-    supabase: Client = create_client(url, key)
+async def check_pdi_tables():
+    try:
+        supabase = get_supabase()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return
     
-    tables = ["pdi_documents", "pdi_entities", "pdi_entity_relations"]
+    print(f"Checking tables: {', '.join(TABLES)} and RPC: match_pdi_entities...")
+    tables_result, rpc_result = await probe_pdi_schema(supabase)
+    
+    if isinstance(tables_result, Exception):
+        print(f"  ERROR: RPC check_tables failed: {str(tables_result)}")
+    else:
+        for row in tables_result.data:
+            if row["exists"]:
+                print(f"  OK: Table {row['name']} exists.")
+            else:
+                print(f"  ERROR: Table {row['name']} does not exist.")
     
-    for table in tables:
-        try:
-            print(f"Checking table: {table}...")
-            result = supabase.table(table).select("*").limit(1).execute()
-            print(f"  OK: Table {table} exists. Data count: {len(result.data)}")
-        except Exception as e:
-            print(f"  ERROR: Table {table} failed or does not exist: {str(e)}")
-            
     # Check RPC
-    try:
-        print("Checking RPC: match_pdi_entities...")
-        # Mock embedding (1536 zeros)
-        mock_embedding = [0.0] * 1536
-        result = supabase.rpc("match_pdi_entities", {
-            "query_embedding": mock_embedding,
-            "match_threshold": 0.5,
-            "match_count": 1
-        }).execute()
-        print(f"  OK: RPC match_pdi_entities exists. Result type: {type(result.data)}")
-    except Exception as e:
-        print(f"  ERROR: RPC match_pdi_entities failed: {str(e)}")
+    if isinstance(rpc_result, Exception):
+        print(f"  ERROR: RPC match_pdi_entities failed: {str(rpc_result)}")
+    elif rpc_result.data:
+        print("  OK: RPC match_pdi_entities exists.")
+    else:
+        print("  ERROR: RPC match_pdi_entities does not exist.")
+
+async def test_pdi_tables(supabase_client):
+    tables_result, rpc_result = await probe_pdi_schema(supabase_client)
+    
+    assert not isinstance(tables_result, Exception), tables_result
+    missing = [row["name"] for row in tables_result.data if not row["exists"]]
+    assert not missing, f"Missing tables: {missing}"
+    
+    assert not isinstance(rpc_result, Exception), rpc_result
+    assert rpc_result.data, "RPC match_pdi_entities does not exist"
 
 if __name__ == "__main__":
     asyncio.run(check_pdi_tables())
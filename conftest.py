@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the root diagnostic scripts
+Run them in one session (one interpreter, one import cycle, one client):
+    pytest check_pdi_db.py test_llm_fix.py test_provider_switch.py
+"""
+
+import os
+
+import pytest
+
+from _clients import get_supabase
+from app.config import get_settings
+
+
+@pytest.fixture(scope="session")
+def supabase_client():
+    """Service-role Supabase client shared by every test in the session."""
+    try:
+        return get_supabase()
+    except RuntimeError as e:
+        pytest.skip(str(e))
+
+
+@pytest.fixture(scope="session")
+def llm_credentials():
+    """Skip live LLM tests when the configured provider has no API key (CI, offline)."""
+    try:
+        settings = get_settings()
+    except Exception as e:
+        pytest.skip(f"Settings unavailable: {e}")
+    
+    if settings.llm_provider.upper() == "VERCEL":
+        token = settings.vercel_ai_gateway_token
+    else:
+        token = settings.openai_api_key or os.getenv("OPENAI_API_KEY")
+    if not token:
+        pytest.skip(f"No API key configured for LLM provider {settings.llm_provider}")
@@ -1,66 +1,262 @@
 import os
 import sys
 import base64
+import binascii
+import hmac
+import json
+import time
+import hashlib
+import argparse
 from dotenv import load_dotenv
 import jwt
-from supabase import create_client
+from jwt.algorithms import HMACAlgorithm
+from jwt.utils import base64url_decode, base64url_encode
 
 # Cargar .env
 load_dotenv()
 
-print("\n🔍 --- EAM COGNITIVE: JWT DEBUGGER V2 --- 🔍")
-print("Diagnóstico avanzado con soporte Base64.")
-
-# 1. Verificar Variables
-secret = os.getenv("SUPABASE_JWT_SECRET")
-# Compatibility with user input
-if not secret:
-    secret = os.getenv("JWT_SECRET")
-
-print(f"\n1. Configuración:"
-      f"\n   - SUPABASE_JWT_SECRET: {'✅ Configurado' if secret else '❌ FALTANTE'}")
-
-if not secret:
-    print("\n❌ ERROR FATAL: Falta el secreto en .env (SUPABASE_JWT_SECRET o JWT_SECRET)")
-    sys.exit(1)
-
-# 2. Solicitar Token
-token = input("\n📋 Pega tu token JWT aquí (sin 'Bearer '): ").strip()
-if token.startswith("Bearer "):
-    token = token[7:]
-
-# 3. Pruebas Local
-print("\n🔑 2. Prueba Validación Local (PyJWT):")
-
-# A. Intento Directo (Raw String)
-print("   👉 A. Intentando con secreto como STRING RAW...")
-try:
-    jwt.decode(
-        token, 
-        secret, 
-        algorithms=["HS256"], 
-        audience="authenticated",
-        options={"verify_exp": True}
-    )
-    print("      ✅ ÉXITO: El secreto se usa tal cual (Raw String).")
-except jwt.InvalidSignatureError:
-    print("      ❌ Fallo Firma: No es string raw.")
-except Exception as e:
-    print(f"      ❌ Error: {str(e)}")
-
-# B. Intento Base64 Decode
-print("   👉 B. Intentando con secreto DECODIFICADO (Base64)...")
-try:
-    decoded_secret = base64.b64decode(secret)
-    jwt.decode(
-        token, 
-        decoded_secret, 
-        algorithms=["HS256"], 
-        audience="authenticated",
-        options={"verify_exp": True}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Diagnóstico de tokens JWT de Supabase")
+    parser.add_argument("--token", help="Token JWT (sin 'Bearer '). Si se omite, se lee de stdin")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Leer un token por línea desde stdin y validarlos todos"
     )
-    print("      ✅ ÉXITO: El secreto requiere Base64 Decode.")
-except Exception as e:
-    print(f"      ❌ Error: {str(e)}")
+    return parser.parse_args()
+
+
+def read_token(args):
+    """Token from --token, piped stdin, or an interactive prompt (in that order)."""
+    if args.token:
+        token = args.token.strip()
+    elif not sys.stdin.isatty():
+        token = sys.stdin.read().strip()
+    else:
+        token = input("\n📋 Pega tu token JWT aquí (sin 'Bearer '): ").strip()
+    return strip_bearer(token)
+
+
+def strip_bearer(token):
+    if token.startswith("Bearer "):
+        token = token[7:]
+    return token
+
+
+_HS256 = HMACAlgorithm(HMACAlgorithm.SHA256)
+
+
+def decode_secret(secret):
+    """Base64 form of the secret, decoded and prepared once for every token."""
+    try:
+        return _HS256.prepare_key(base64.b64decode(secret)), None
+    except Exception as e:
+        return None, e
+
+
+# (blake2b(token), key) -> (claims, exp); a hit only re-checks exp
+_JWT_CACHE: dict[tuple[bytes, bytes], tuple[dict, int]] = {}
+
+
+# Keyed HMAC-SHA256 states; copy() reuses the ipad/opad key schedule
+_HMAC_STATES: dict[bytes, hmac.HMAC] = {}
+
+
+def hmac_state(key):
+    state = _HMAC_STATES.get(key)
+    if state is None:
+        state = _HMAC_STATES[key] = hmac.new(key, digestmod=hashlib.sha256)
+    return state
+
+
+def decode_segment(segment, name):
+    """base64url-decode one token segment, rejecting non-canonical encodings like PyJWT."""
+    try:
+        decoded = base64url_decode(segment)
+    except (TypeError, binascii.Error):
+        raise jwt.DecodeError(f"Invalid {name} padding") from None
+    if base64url_encode(decoded) != segment.rstrip(b"="):
+        raise jwt.DecodeError(f"Invalid {name} padding")
+    return decoded
+
+
+def load_json_object(data, name):
+    try:
+        value = json.loads(data)
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid {name} string: {e}") from None
+    if not isinstance(value, dict):
+        raise jwt.DecodeError(f"Invalid {name} string: must be a json object")
+    return value
+
+
+def parse_token(token):
+    """Split and decode the token once: (signing_input, payload, signature)."""
+    try:
+        signing_input, crypto_segment = token.encode().rsplit(b".", 1)
+        header_segment, payload_segment = signing_input.split(b".", 1)
+    except ValueError:
+        raise jwt.DecodeError("Not enough segments") from None
+    header = load_json_object(decode_segment(header_segment, "header"), "header")
+    payload = decode_segment(payload_segment, "payload")
+    signature = decode_segment(crypto_segment, "crypto")
+    if "alg" not in header:
+        raise jwt.InvalidAlgorithmError("Algorithm not specified")
+    if header["alg"] != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+    return signing_input, payload, signature
+
+
+def int_claim(claims, name, error):
+    try:
+        return int(claims[name])
+    except (ValueError, TypeError, OverflowError):
+        raise error from None
+
+
+def check_claims(claims, now):
+    """The iat/nbf/exp/aud checks jwt.decode ran, in the same order and with its errors."""
+    if "iat" in claims:
+        iat = int_claim(claims, "iat", jwt.InvalidIssuedAtError("Issued At claim (iat) must be an integer."))
+        if iat > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in claims:
+        nbf = int_claim(claims, "nbf", jwt.DecodeError("Not Before claim (nbf) must be an integer."))
+        if nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "exp" in claims:
+        exp = int_claim(claims, "exp", jwt.DecodeError("Expiration Time claim (exp) must be an integer."))
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    if not claims.get("aud"):
+        raise jwt.MissingRequiredClaimError("aud")
+    audience = claims["aud"]
+    if isinstance(audience, str):
+        audience = [audience]
+    if not isinstance(audience, list) or not all(isinstance(a, str) for a in audience):
+        raise jwt.InvalidAudienceError("Invalid claim format in token")
+    if "authenticated" not in audience:
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+
+def validate_claims(payload, now):
+    """Read the payload and check its claims once after a signature match: (claims, error)."""
+    try:
+        claims = load_json_object(payload, "payload")
+        check_claims(claims, now)
+    except jwt.PyJWTError as e:
+        return None, e
+    return claims, None
+
+
+def verify_token(token, keys):
+    """
+    Validate a token against several keys; returns one exception or None per key.
+    The token is parsed and its claims checked once; only the HMAC differs per key.
+    """
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    results = {}
+    pending = []
+    for key in keys:
+        cached = _JWT_CACHE.get((digest, key))
+        if cached is not None and cached[1] > now:
+            results[key] = None
+        else:
+            _JWT_CACHE.pop((digest, key), None)
+            pending.append(key)
+    
+    if pending:
+        try:
+            signing_input, payload, signature = parse_token(token)
+        except jwt.PyJWTError as e:
+            return [results.get(key, e) for key in keys]
+        
+        claims, claims_error = None, None
+        claims_checked = False
+        for key in pending:
+            mac = hmac_state(key).copy()
+            mac.update(signing_input)
+            expected = mac.digest()
+            if not hmac.compare_digest(expected, signature):
+                results[key] = jwt.InvalidSignatureError("Signature verification failed")
+                continue
+            if not claims_checked:
+                # Like jwt.decode, the payload JSON is only read once a signature matches
+                claims, claims_error = validate_claims(payload, now)
+                claims_checked = True
+            results[key] = claims_error
+            if claims_error is None and "exp" in claims:
+                _JWT_CACHE[(digest, key)] = (claims, int(claims["exp"]))
+    
+    return [results[key] for key in keys]
+
+
+def check_token(token, raw_secret, decoded_secret, decode_error):
+    # 3. Pruebas Local
+    print("\n🔑 2. Prueba Validación Local (PyJWT):")
+    
+    keys = [raw_secret] if decoded_secret is None else [raw_secret, decoded_secret]
+    errors = verify_token(token, keys)
+    
+    # A. Intento Directo (Raw String)
+    print("   👉 A. Intentando con secreto como STRING RAW...")
+    error = errors[0]
+    if error is None:
+        print("      ✅ ÉXITO: El secreto se usa tal cual (Raw String).")
+    elif isinstance(error, jwt.InvalidSignatureError):
+        print("      ❌ Fallo Firma: No es string raw.")
+    else:
+        print(f"      ❌ Error: {str(error)}")
+    
+    # B. Intento Base64 Decode
+    print("   👉 B. Intentando con secreto DECODIFICADO (Base64)...")
+    if decoded_secret is None:
+        print(f"      ❌ Error: {str(decode_error)}")
+        return
+    error = errors[1]
+    if error is None:
+        print("      ✅ ÉXITO: El secreto requiere Base64 Decode.")
+    else:
+        print(f"      ❌ Error: {str(error)}")
+
+
+def main():
+    args = parse_args()
+    
+    print("\n🔍 --- EAM COGNITIVE: JWT DEBUGGER V2 --- 🔍")
+    print("Diagnóstico avanzado con soporte Base64.")
+    
+    # 1. Verificar Variables
+    secret = os.getenv("SUPABASE_JWT_SECRET")
+    # Compatibility with user input
+    if not secret:
+        secret = os.getenv("JWT_SECRET")
+    
+    print(f"\n1. Configuración:"
+          f"\n   - SUPABASE_JWT_SECRET: {'✅ Configurado' if secret else '❌ FALTANTE'}")
+    
+    if not secret:
+        print("\n❌ ERROR FATAL: Falta el secreto en .env (SUPABASE_JWT_SECRET o JWT_SECRET)")
+        sys.exit(1)
+    
+    raw_secret = _HS256.prepare_key(secret)
+    decoded_secret, decode_error = decode_secret(secret)
+    
+    # 2. Solicitar Token(s)
+    if args.batch:
+        tokens = [strip_bearer(line.strip()) for line in sys.stdin if line.strip()]
+    else:
+        tokens = [read_token(args)]
+    
+    for i, token in enumerate(tokens, 1):
+        if args.batch:
+            print(f"\n🎫 Token {i}/{len(tokens)}")
+        check_token(token, raw_secret, decoded_secret, decode_error)
+    
+    print("\n---------------------------------------------------")
+
 
-print("\n---------------------------------------------------")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+-- EAM Cognitive OS - OKR alignment search
+-- Moves OKRAlignmentTool keyword scoring into Postgres full-text search
+
+-- ============================================================================
+-- MIGRATION 009: Full-text index on active objectives
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_objectives_fts ON objectives
+    USING gin (to_tsvector('spanish', title || ' ' || coalesce(description, '')))
+    WHERE is_active;
+
+-- ============================================================================
+-- MIGRATION 010: Create function for OKR keyword matching
+-- ============================================================================
+CREATE OR REPLACE FUNCTION match_okrs(
+    query TEXT,
+    k INT DEFAULT 3
+)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    relevance FLOAT,
+    progress INT,
+    total_matches BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH q AS (
+        -- Any keyword matches (OR), as the previous in-app scorer did
+        SELECT replace(plainto_tsquery('spanish', query)::text, ' & ', ' | ')::tsquery AS tsq
+    )
+    SELECT
+        o.id,
+        o.title::text,
+        ts_rank_cd(
+            to_tsvector('spanish', o.title || ' ' || coalesce(o.description, '')),
+            q.tsq,
+            32  -- rank / (rank + 1), keeps relevance in [0, 1)
+        )::float AS relevance,
+        o.progress::int,
+        count(*) OVER () AS total_matches
+    FROM objectives o, q
+    WHERE
+        o.is_active
+        AND to_tsvector('spanish', o.title || ' ' || coalesce(o.description, '')) @@ q.tsq
+    ORDER BY relevance DESC
+    LIMIT k;
+$$;
@@ -0,0 +1,12 @@
+-- EAM Cognitive OS - Memory similarity index
+-- MemorySearchTool now queries match_memories(); serve it with HNSW
+
+-- ============================================================================
+-- MIGRATION 011: Replace IVFFlat with HNSW on memories.embedding
+-- ============================================================================
+-- HNSW needs no training data (IVFFlat lists were built on an empty table)
+-- and keeps recall as memories are added.
+DROP INDEX IF EXISTS idx_memories_embedding;
+
+CREATE INDEX IF NOT EXISTS idx_memories_embedding_hnsw ON memories
+    USING hnsw (embedding vector_cosine_ops);
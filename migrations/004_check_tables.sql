@@ -0,0 +1,18 @@
+-- EAM Cognitive OS - Schema probes
+-- Lets maintenance scripts check several tables in one round trip
+
+-- ============================================================================
+-- MIGRATION 012: Create function for table existence checks
+-- ============================================================================
+CREATE OR REPLACE FUNCTION check_tables(names TEXT[])
+RETURNS TABLE (
+    name TEXT,
+    "exists" BOOLEAN
+)
+LANGUAGE sql
+STABLE
+AS $$
+    -- Catalog lookup only, no rows are read from the tables themselves
+    SELECT n AS name, to_regclass('public.' || quote_ident(n)) IS NOT NULL AS "exists"
+    FROM unnest(names) AS n;
+$$;
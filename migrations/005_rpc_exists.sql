@@ -0,0 +1,18 @@
+-- EAM Cognitive OS - Schema probes
+-- Lets maintenance scripts check for a function without calling it
+
+-- ============================================================================
+-- MIGRATION 013: Create function for RPC existence checks
+-- ============================================================================
+CREATE OR REPLACE FUNCTION rpc_exists(n TEXT)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT EXISTS (
+        SELECT 1
+        FROM pg_proc p
+        JOIN pg_namespace ns ON ns.oid = p.pronamespace
+        WHERE ns.nspname = 'public' AND p.proname = n
+    );
+$$;
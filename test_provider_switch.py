@@ -1,32 +1,46 @@
 import os
 import sys
-import asyncio
-
-# Mock environment before importing app modules
-os.environ["LLM_PROVIDER"] = "OPENAI"
-# Ensure we don't accidentally use Vercel URL
-if "VERCEL_AI_GATEWAY_URL" in os.environ:
-    del os.environ["VERCEL_AI_GATEWAY_URL"]
 
 # Add backend to path
 sys.path.append(os.path.join(os.getcwd(), "backend"))
 
 from app.config import get_settings
-from app.core.llm import get_llm_client
+from app.core.llm import get_llm_base_url
+
+def use_openai_provider():
+    """Mock environment: force the OpenAI provider."""
+    os.environ["LLM_PROVIDER"] = "OPENAI"
+    # Ensure we don't accidentally use Vercel URL
+    os.environ.pop("VERCEL_AI_GATEWAY_URL", None)
 
-def test_config():
+def check_config():
+    # Settings are memoized: drop any instance built before LLM_PROVIDER was set
+    get_settings.cache_clear()
     settings = get_settings()
+    assert get_settings() is settings, "get_settings() should return the cached instance"
     print(f"Provider: {settings.llm_provider}")
     print(f"Vercel URL: {settings.vercel_ai_gateway_url}")
     
-    client = get_llm_client()
-    print(f"Client Base URL: {client.base_url}")
+    # Resolve the URL the client would use without building the client itself
+    base_url = get_llm_base_url()
+    print(f"Client Base URL: {base_url}")
     
     # OpenAI default base url should be https://api.openai.com/v1/
-    if "api.openai.com" in str(client.base_url):
+    if "api.openai.com" in base_url:
         print("✅ Client is using OpenAI direct URL")
     else:
-        print(f"❌ Client is NOT using OpenAI URL: {client.base_url}")
+        print(f"❌ Client is NOT using OpenAI URL: {base_url}")
+    return base_url
+
+def test_config(monkeypatch):
+    # Scoped to this test so the rest of a shared pytest session keeps its provider
+    monkeypatch.setenv("LLM_PROVIDER", "OPENAI")
+    monkeypatch.delenv("VERCEL_AI_GATEWAY_URL", raising=False)
+    try:
+        assert "api.openai.com" in check_config()
+    finally:
+        get_settings.cache_clear()
 
 if __name__ == "__main__":
-    test_config()
+    use_openai_provider()
+    check_config()